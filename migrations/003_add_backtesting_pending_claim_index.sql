@@ -0,0 +1,7 @@
+-- 워커의 pending job 점유 쿼리(status='pending' ORDER BY created_at LIMIT 1 FOR UPDATE SKIP LOCKED)용 부분 인덱스
+-- - 완료/실패 row가 누적되어도 pending row만 인덱싱하므로 인덱스가 작게 유지됩니다.
+-- - 운영 DB에서는 CONCURRENTLY로 생성해 쓰기 락을 피합니다(트랜잭션 블록 밖에서 실행).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS backtesting_pending_created_at_idx
+  ON public.backtesting (created_at)
+  WHERE status = 'pending';
@@ -14,9 +14,12 @@ def _env(key: str, default: str) -> str:
 
 
 PARSE_MODEL = _env("BACKTEST_AGENT_MODEL_PARSE", "")
-ADJUST_MODEL = _env("BACKTEST_AGENT_MODEL_ADJUST", "")
+# adjust(작은 스키마)/report(요약 서술)는 소형 모델로도 충분하므로 기본값을 mini로 둡니다.
+ADJUST_MODEL = _env("BACKTEST_AGENT_MODEL_ADJUST", "gpt-4o-mini")
 AUDIT_MODEL = _env("BACKTEST_AGENT_MODEL_AUDIT", "")
-REPORT_MODEL = _env("BACKTEST_AGENT_MODEL_REPORT", "")
+REPORT_MODEL = _env("BACKTEST_AGENT_MODEL_REPORT", "gpt-4o-mini")
+# 거래 0건/과도한 MDD 등 해석이 까다로운 결과에서만 사용하는 상위 모델
+REPORT_ESCALATION_MODEL = _env("BACKTEST_AGENT_MODEL_REPORT_ESCALATION", "gpt-4o")
 
 
 parse_request_agent = Agent(
@@ -0,0 +1,99 @@
+"""에이전트/도구 결과 캐시(프로세스 로컬).
+
+동일한 payload에 대해 LLM 파서를 반복 호출하거나, 같은 입력으로 종목 해석/사전 점검 DB 조회를
+반복하지 않도록 결과를 TTL 기반으로 보관합니다. 워커 프로세스 단위 캐시이므로 프로세스 재시작 시
+비워집니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import orjson
+
+
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)) or default)
+    except Exception:
+        return default
+
+
+# 0 이하이면 캐시 비활성화
+PARSE_CACHE_TTL_SECONDS = _env_int("BACKTEST_AGENT_PARSE_CACHE_TTL_SECONDS", 3600)
+PARSE_CACHE_MAXSIZE = _env_int("BACKTEST_AGENT_PARSE_CACHE_MAXSIZE", 1024)
+RESOLVE_SYMBOLS_CACHE_TTL_SECONDS = _env_int("BACKTEST_RESOLVE_SYMBOLS_CACHE_TTL_SECONDS", 300)
+RESOLVE_SYMBOLS_CACHE_MAXSIZE = _env_int("BACKTEST_RESOLVE_SYMBOLS_CACHE_MAXSIZE", 512)
+PREFLIGHT_CACHE_TTL_SECONDS = _env_int("BACKTEST_PREFLIGHT_CACHE_TTL_SECONDS", 120)
+PREFLIGHT_CACHE_MAXSIZE = _env_int("BACKTEST_PREFLIGHT_CACHE_MAXSIZE", 256)
+
+
+class TTLCache:
+    """key -> (만료시각, 값) LRU 캐시. Redis `GET`/`SETEX`와 같은 인터페이스를 제공합니다.
+
+    동기 도구가 스레드(asyncio.to_thread)에서 호출되므로 내부 상태는 lock으로 보호합니다.
+    """
+
+    def __init__(self, *, maxsize: int = 1024) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                self._data.pop(key, None)
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def setex(self, key: Hashable, ttl_seconds: int, value: Any) -> None:
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _normalize_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    # user_id는 파싱 결과에 영향을 주지 않으므로 키에서 제외(사용자 간 동일 요청 공유)
+    return {k: v for k, v in payload.items() if k != "user_id"}
+
+
+def parse_cache_key(*, prompt_version: str, model: str, payload: Dict[str, Any]) -> str:
+    """prompt_version + 모델 + 정규화 payload의 안정적인 sha256 키.
+
+    '3년치' 같은 상대 기간은 실행일에 따라 해석이 달라지므로 오늘 날짜도 키에 포함합니다.
+    """
+
+    body = orjson.dumps(
+        _normalize_payload(payload),
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    prefix = f"{prompt_version}|{model}|{date.today().isoformat()}|".encode("utf-8")
+    return hashlib.sha256(prefix + body).hexdigest()
+
+
+parse_cache = TTLCache(maxsize=PARSE_CACHE_MAXSIZE)
+resolve_symbols_cache = TTLCache(maxsize=RESOLVE_SYMBOLS_CACHE_MAXSIZE)
+preflight_cache = TTLCache(maxsize=PREFLIGHT_CACHE_MAXSIZE)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 import re
 from typing import Any, List
 
+import orjson
 from agents import (
     Agent,
     GuardrailFunctionOutput,
@@ -15,15 +15,38 @@ from agents import (
 
 from backtesting.agents.schemas import BacktestAgentContext, FinalNarrative
 
-_SECRET_RE = re.compile(r"\bsk-[A-Za-z0-9]{10,}\b")
-_PG_DSN_RE = re.compile(r"\bpostgresql(\+[\w]+)?://[^\s]+\b", re.IGNORECASE)
+# sk- 토큰/Postgres DSN을 하나의 패턴으로 묶어 입력을 한 번만 스캔합니다.
+# (DSN 꼬리는 \S+로 단순화해 `[^\s]+\b` 형태의 역추적 비용을 없앰)
+_SENSITIVE_RE = re.compile(
+    r"(?P<secret>\bsk-[A-Za-z0-9]{10,}\b)"
+    r"|(?P<dsn>\b(?i:postgresql)(?:\+\w+)?://\S+)"
+)
+
+
+def _scan_sensitive(text: str) -> tuple[bool, bool]:
+    """(has_secret, has_dsn)를 단일 패스로 판정합니다."""
+
+    # 대부분의 입력은 둘 다 없으므로, C 레벨 substring 검사로 정규식 스캔 자체를 생략
+    # (DSN은 대소문자 무시 매칭이라 lower() 복사 대신 "://" 존재로 거릅니다)
+    if "sk-" not in text and "://" not in text:
+        return False, False
+
+    has_secret = has_dsn = False
+    for m in _SENSITIVE_RE.finditer(text):
+        if m.lastgroup == "secret":
+            has_secret = True
+        else:
+            has_dsn = True
+        if has_secret and has_dsn:
+            break
+    return has_secret, has_dsn
 
 
 def _stringify_input(input_data: str | List[TResponseInputItem]) -> str:
     if isinstance(input_data, str):
         return input_data
     try:
-        return json.dumps(input_data, ensure_ascii=False, default=str)
+        return orjson.dumps(input_data, default=str).decode("utf-8")
     except Exception:
         return str(input_data)
 
@@ -36,9 +59,7 @@ async def secrets_input_guardrail(
 ) -> GuardrailFunctionOutput:
     """민감정보(sk- 토큰/DB DSN 등)가 LLM 입력으로 넘어가는 것을 차단."""
 
-    text = _stringify_input(input)
-    has_secret = bool(_SECRET_RE.search(text))
-    has_dsn = bool(_PG_DSN_RE.search(text))
+    has_secret, has_dsn = _scan_sensitive(_stringify_input(input))
 
     return GuardrailFunctionOutput(
         output_info={"has_secret": has_secret, "has_dsn": has_dsn},
@@ -54,9 +75,7 @@ async def secrets_output_guardrail(
 ) -> GuardrailFunctionOutput:
     """민감정보가 리포트에 포함되는 것을 차단."""
 
-    md = output.analysis_md or ""
-    has_secret = bool(_SECRET_RE.search(md))
-    has_dsn = bool(_PG_DSN_RE.search(md))
+    has_secret, has_dsn = _scan_sensitive(output.analysis_md or "")
 
     return GuardrailFunctionOutput(
         output_info={"has_secret": has_secret, "has_dsn": has_dsn},
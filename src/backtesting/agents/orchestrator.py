@@ -1,21 +1,34 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import logging
 import os
 import re
 import time
 from datetime import date, datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from agents import Runner, trace
+import orjson
+from agents import Agent, ModelSettings, Runner, trace
+from dotenv import load_dotenv
 
-from backtesting.agents.agents import (
+# agents/cache 모듈이 import 시점에 모델명·캐시 설정을 env에서 읽고, tools(portfolio_backtest)는
+# 지연 import하므로 .env는 backtesting.agents 모듈을 import하기 전에 여기서 직접 로드합니다.
+load_dotenv()
+
+from backtesting.agents.agents import (  # noqa: E402
+    PARSE_MODEL,
+    REPORT_ESCALATION_MODEL,
+    REPORT_MODEL,
     adjust_plan_agent,
     audit_result_agent,
     parse_request_agent,
     report_agent,
 )
-from backtesting.agents.schemas import (
+from backtesting.agents.cache import PARSE_CACHE_TTL_SECONDS, parse_cache, parse_cache_key  # noqa: E402
+from backtesting.agents.schemas import (  # noqa: E402
     AdjustmentPlan,
     AuditResult,
     BacktestAgentContext,
@@ -23,13 +36,26 @@ from backtesting.agents.schemas import (
     ParsedRequest,
     PreflightReport,
 )
-from backtesting.agents.tools import (
-    persist_completed_impl,
-    persist_failed_impl,
-    preflight_data_check_impl,
-    resolve_symbols_impl,
-    run_backtest_impl,
-)
+
+from backtesting.agents.persist import persist_completed_impl, persist_failed_impl  # noqa: E402
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _get_tools() -> ModuleType:
+    """tools 모듈을 반환합니다.
+
+    tools는 portfolio_backtest(backtrader/pandas/SQLAlchemy)를 끌어오므로 첫 job 처리 시점까지
+    import를 미룹니다(워커 기동/fail-fast 경로/단위 테스트의 import 비용 절감).
+    """
+
+    from backtesting.agents import tools
+
+    return tools
 
 
 def _to_bool(v: Optional[str], default: bool = False) -> bool:
@@ -43,8 +69,79 @@ def _to_bool(v: Optional[str], default: bool = False) -> bool:
     return default
 
 
+# 환경변수 기반 설정(job마다 os.getenv를 반복하지 않도록 모듈 로드 시 1회 읽음)
+_MAX_RETRIES = 2
+_PROMPT_VERSION = "v1"
+_ALLOW_FULL = False
+_SPECULATIVE_REPORT = False
+_PROMPT_CACHE_BUCKETS = 16
+_TRADES_HEAD = 50
+_REPORT_TRADES_HEAD = 200
+
+
+def reload_env() -> None:
+    """환경변수 기반 설정을 다시 읽습니다(테스트/개발 중 설정 변경 반영용)."""
+
+    global _MAX_RETRIES, _PROMPT_VERSION, _ALLOW_FULL, _SPECULATIVE_REPORT
+    global _PROMPT_CACHE_BUCKETS, _TRADES_HEAD, _REPORT_TRADES_HEAD
+
+    _MAX_RETRIES = int(os.getenv("BACKTEST_AGENT_MAX_RETRIES", "2") or 2)
+    _PROMPT_VERSION = os.getenv("BACKTEST_AGENT_PROMPT_VERSION", "v1") or "v1"
+    _ALLOW_FULL = _to_bool(os.getenv("ALLOW_FULL_UNIVERSE"), default=False)
+    # audit 통과를 가정하고 report를 audit과 병렬 실행(재시도/실패 시 report 호출 1회 낭비)
+    _SPECULATIVE_REPORT = _to_bool(
+        os.getenv("BACKTEST_AGENT_SPECULATIVE_REPORT"), default=False
+    )
+    _PROMPT_CACHE_BUCKETS = max(
+        1, int(os.getenv("BACKTEST_AGENT_PROMPT_CACHE_BUCKETS", "16") or 16)
+    )
+    _TRADES_HEAD = int(os.getenv("BACKTEST_AGENT_TRADES_HEAD", "50") or 50)
+    _REPORT_TRADES_HEAD = int(os.getenv("BACKTEST_AGENT_REPORT_TRADES_HEAD", "200") or 200)
+
+
+reload_env()
+
+
 def _json_dumps(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, default=str, indent=2)
+    # 에이전트 입력은 기계가 읽으므로 공백 없이 직렬화(입력 토큰 절감)
+    return orjson.dumps(
+        obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY, default=str
+    ).decode("utf-8")
+
+
+# LLM 입력에 싣는 거래 로그 필드(amount=size*price 등 파생값은 제외)
+_TRADE_KEYS = ("date", "symbol", "action", "size", "price")
+# 리포트는 매매 근거 서술에 신호 사유(reason)가 필요하므로 포함
+_REPORT_TRADE_KEYS = _TRADE_KEYS + ("reason",)
+
+
+def _project_trades(trades: Any, n: int, keys: tuple[str, ...] = _TRADE_KEYS) -> list[Dict[str, Any]]:
+    """앞 n건만 남기고 각 거래를 keys로 투영합니다."""
+
+    return [
+        {k: t[k] for k in keys if k in t} if isinstance(t, dict) else t
+        for t in (trades or [])[: max(0, n)]
+    ]
+
+
+def _preflight_brief(preflight: PreflightReport) -> Dict[str, Any]:
+    # 종목별 price/dart 커버리지 상세는 감사 프롬프트에서 참조하지 않으므로 제외
+    return preflight.model_dump(exclude={"price", "dart"})
+
+
+def _with_prompt_cache_key(agent: Agent, user_id: int) -> Agent:
+    """OpenAI 프롬프트 캐시 라우팅 키(prompt_cache_key)를 붙인 agent 복제본을 반환합니다.
+
+    같은 버킷의 요청이 같은 캐시 노드로 라우팅되어 instructions prefix 캐시 적중률이 올라갑니다.
+    instructions는 job마다 바뀌지 않는 정적 system 메시지이고 job 데이터는 별도 user 턴으로
+    전달되므로, prefix는 에이전트별로 항상 동일합니다.
+    """
+
+    key = f"{agent.name}:{int(user_id) % _PROMPT_CACHE_BUCKETS}"
+    settings = agent.model_settings.resolve(
+        ModelSettings(extra_body={"prompt_cache_key": key})
+    )
+    return agent.clone(model_settings=settings)
 
 
 def _extract_parameters(payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -52,7 +149,7 @@ def _extract_parameters(payload: Dict[str, Any]) -> Dict[str, Any]:
     raw_params = payload.get("parameters")
     if isinstance(raw_params, str):
         try:
-            raw_params = json.loads(raw_params)
+            raw_params = orjson.loads(raw_params)
         except Exception:
             raw_params = {}
     if isinstance(raw_params, dict):
@@ -104,11 +201,39 @@ def _merge_backtest_params(
     return params
 
 
+# ParsedRequest가 채우는 BacktestInput 필드(_merge_backtest_params 참고). 모두 payload에 있을 때만 파싱 생략
+_PARSE_REQUIRED_FIELDS = ("target_symbols", "start_date", "end_date", "sort_by")
+_PARSE_OPTIONAL_FIELDS = (
+    "rebalancing_period",
+    "max_positions",
+    "max_portfolio_size",
+    "initial_cash",
+    "use_dart_disclosure",
+)
+
+
+# \d는 기본적으로 유니코드 숫자(전각 등)도 매칭하므로 ASCII로 한정
+_SYMBOL_RE = re.compile(r"\d{6}", re.ASCII)
+
+
+def _normalize_date(s: Any) -> Optional[str]:
+    """YYYY-M-D 형식(0 패딩 선택)을 검증해 YYYY-MM-DD로 정규화합니다. 유효하지 않으면 None."""
+
+    if not isinstance(s, str) or not s.strip():
+        return None
+    try:
+        return datetime.strptime(s.strip(), "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        return None
+
+
+def _is_str(x: Any) -> bool:
+    return isinstance(x, str)
+
+
 def _apply_param_guardrails(params: Dict[str, Any]) -> Dict[str, Any]:
     """운영 안전장치(결정적) 적용."""
 
-    allow_full = _to_bool(os.getenv("ALLOW_FULL_UNIVERSE"), default=False)
-
     target_symbols = params.get("target_symbols")
     if isinstance(target_symbols, str):
         target_symbols = [target_symbols]
@@ -117,41 +242,31 @@ def _apply_param_guardrails(params: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(target_symbols, list):
         target_symbols = []
 
-    target_symbols = [s.strip() for s in target_symbols if isinstance(s, str) and s.strip()]
-    target_symbols = sorted(set([s for s in target_symbols if len(s) == 6 and s.isdigit()]))
+    target_symbols = sorted(
+        {s for s in map(str.strip, filter(_is_str, target_symbols)) if _SYMBOL_RE.fullmatch(s)}
+    )
     if target_symbols:
         params["target_symbols"] = target_symbols
 
-    if not allow_full and not target_symbols:
+    if not _ALLOW_FULL and not target_symbols:
         # target_corp_names는 resolve_symbols 단계에서 변환을 시도하므로 여기서는 즉시 fail하지 않고,
         # 최종적으로도 비어 있으면 실패 처리.
         pass
 
     # 날짜 포맷 검증(LLM 출력이 비정형이면 제거 후, query 기반 보정에 맡김)
-    def _valid_date(s: Any) -> bool:
-        if not isinstance(s, str) or not s.strip():
-            return False
-        try:
-            datetime.strptime(s.strip(), "%Y-%m-%d")
-            return True
-        except Exception:
-            return False
-
+    for key in ("start_date", "end_date"):
+        if params.get(key) is None:
+            continue
+        normalized = _normalize_date(params[key])
+        if normalized is None:
+            params.pop(key, None)
+        else:
+            params[key] = normalized
     sd = params.get("start_date")
     ed = params.get("end_date")
-    if sd is not None and not _valid_date(sd):
-        params.pop("start_date", None)
-    if ed is not None and not _valid_date(ed):
-        params.pop("end_date", None)
-    sd2 = params.get("start_date")
-    ed2 = params.get("end_date")
-    if _valid_date(sd2) and _valid_date(ed2):
-        try:
-            if str(sd2) > str(ed2):
-                # YYYY-MM-DD 문자열은 사전식 비교가 날짜 비교와 동일
-                params["start_date"], params["end_date"] = str(ed2), str(sd2)
-        except Exception:
-            pass
+    if sd and ed and sd > ed:
+        # 정규화된 YYYY-MM-DD 문자열은 사전식 비교가 날짜 비교와 동일
+        params["start_date"], params["end_date"] = ed, sd
 
     # 상한/기본값
     max_positions = params.get("max_positions")
@@ -174,41 +289,31 @@ def _apply_param_guardrails(params: Dict[str, Any]) -> Dict[str, Any]:
     return params
 
 
+# 마지막 조각에 붙는 기간/요청 문구("3년", "백테스트 ...")의 시작 위치
+_QUERY_TAIL_RE = re.compile(r"\b\d+\s*년|\b백테")
+# (주), ㈜ 변형 (DB corp_name 매칭률 향상을 위해 제거)
+_CORP_MARK_RE = re.compile(r"㈜|\(주\)?|주\)")
+
+
 def _extract_corp_names_from_query(query: Optional[str]) -> list[str]:
     """자연어 요청에서 회사명 후보를 결정적으로 추출(LLM 보조 실패 대비)."""
     if not query or not isinstance(query, str):
         return []
 
-    parts = [p.strip() for p in query.split(",") if p and p.strip()]
+    parts = [p.strip() for p in query.split(",") if p.strip()]
     if not parts:
         return []
 
     # 마지막 조각에 붙는 기간/요청 문구 제거
-    last = parts[-1]
-    last = re.split(r"\b\d+\s*년", last, maxsplit=1)[0].strip()
-    last = re.split(r"\b백테", last, maxsplit=1)[0].strip()
-    if last:
-        parts[-1] = last
-
-    cleaned: list[str] = []
-    for p in parts:
-        s = p.strip()
-        if not s:
-            continue
-        # (주), ㈜ 변형 제거 (DB corp_name 매칭률 향상)
-        s = s.replace("㈜", "").replace("(주)", "").replace("주)", "").replace("(주", "")
-        s = s.strip()
-        if len(s) >= 2:
-            cleaned.append(s)
+    m = _QUERY_TAIL_RE.search(parts[-1])
+    if m is not None:
+        last = parts[-1][: m.start()].strip()
+        if last:
+            parts[-1] = last
+
+    cleaned = (_CORP_MARK_RE.sub("", p).strip() for p in parts)
     # unique preserve order
-    seen = set()
-    out: list[str] = []
-    for s in cleaned:
-        if s in seen:
-            continue
-        seen.add(s)
-        out.append(s)
-    return out[:20]
+    return list(dict.fromkeys(s for s in cleaned if len(s) >= 2))[:20]
 
 
 def _maybe_apply_years_range_from_query(params: Dict[str, Any], query: Optional[str]) -> Dict[str, Any]:
@@ -269,23 +374,151 @@ def _apply_adjustment(params: Dict[str, Any], adj: AdjustmentPlan) -> Dict[str,
     return params
 
 
-def _build_output_summary(output_dict: Dict[str, Any]) -> Dict[str, Any]:
-    def _f(x: Any) -> Optional[float]:
-        try:
-            return None if x is None else float(x)
-        except Exception:
-            return None
-
+async def _parse_request(
+    payload: Dict[str, Any],
+    *,
+    prompt_version: str,
+    user_id: int,
+    ctx: BacktestAgentContext,
+) -> ParsedRequest:
+    """parse_request_agent 호출(캐시 우선)."""
+
+    # 동일 payload 재요청은 캐시된 structured output을 재사용(LLM 왕복 생략)
+    cache_key = parse_cache_key(prompt_version=prompt_version, model=PARSE_MODEL, payload=payload)
+    cached = parse_cache.get(cache_key)
+    if cached is not None:
+        return ParsedRequest.model_validate_json(cached)
+
+    parse_input = {"payload": payload}
+    parse_result = await Runner.run(
+        _with_prompt_cache_key(parse_request_agent, user_id),
+        _json_dumps(parse_input),
+        context=ctx,
+    )
+    parsed = parse_result.final_output_as(ParsedRequest)
+    parse_cache.setex(cache_key, PARSE_CACHE_TTL_SECONDS, parsed.model_dump_json())
+    return parsed
+
+
+def _build_report_input(
+    *,
+    backtest_params: Dict[str, Any],
+    preflight: PreflightReport,
+    audit: Optional[AuditResult],
+    output_summary: Dict[str, Any],
+    output_dict: Dict[str, Any],
+) -> Dict[str, Any]:
     return {
-        "total_return": _f(output_dict.get("total_return")),
-        "annualized_return": _f(output_dict.get("annualized_return")),
-        "mdd": _f(output_dict.get("mdd")),
-        "sharpe_ratio": _f(output_dict.get("sharpe_ratio")),
-        "win_rate": _f(output_dict.get("win_rate")),
-        "total_trades": int(output_dict.get("total_trades") or 0),
-        "total_profit": _f(output_dict.get("total_profit")),
-        "total_loss": _f(output_dict.get("total_loss")),
+        "backtest_params": backtest_params,
+        "preflight_report": preflight.model_dump(),
+        "audit_result": audit.model_dump() if audit is not None else None,
+        "output_summary": output_summary,
+        "trades_head": _project_trades(
+            output_dict.get("trades"),
+            _REPORT_TRADES_HEAD,
+            _REPORT_TRADE_KEYS,
+        ),
+    }
+
+
+async def _plan_adjustment(
+    *,
+    stage: str,
+    backtest_params: Dict[str, Any],
+    preflight: PreflightReport,
+    audit: Optional[AuditResult],
+    ctx: BacktestAgentContext,
+    memo: Dict[str, AdjustmentPlan],
+) -> AdjustmentPlan:
+    """adjust_plan_agent 호출. 같은 job에서 동일한 (stage, 점검/감사 결과)가 재발하면 이전 수정안을 재사용."""
+
+    key = hashlib.sha256(
+        orjson.dumps(
+            {
+                "stage": stage,
+                "preflight_report": preflight.model_dump(),
+                "audit_feedback": audit.model_dump() if audit is not None else None,
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+    ).hexdigest()
+    cached = memo.get(key)
+    if cached is not None:
+        return cached
+
+    adjust_input = {
+        "stage": stage,
+        "backtest_params": backtest_params,
+        "preflight_report": preflight.model_dump(),
+        "audit_feedback": audit.model_dump() if audit is not None else None,
     }
+    adj_run = await Runner.run(
+        _with_prompt_cache_key(adjust_plan_agent, ctx.user_id),
+        _json_dumps(adjust_input),
+        context=ctx,
+    )
+    plan = adj_run.final_output_as(AdjustmentPlan)
+    memo[key] = plan
+    return plan
+
+
+def _pick_report_model(summary: Dict[str, Any]) -> str:
+    """결과 난이도에 따라 report 모델을 고릅니다(기본 소형, 이상 징후 시 상위 모델)."""
+
+    if int(summary.get("total_trades") or 0) == 0 or float(summary.get("mdd") or 0.0) > 80:
+        return REPORT_ESCALATION_MODEL
+    return REPORT_MODEL
+
+
+async def _run_report(
+    report_input: Dict[str, Any], *, ctx: BacktestAgentContext, model: str
+) -> tuple[Optional[str], Optional[Dict[str, Any]], Optional[float]]:
+    """report_agent 호출(best-effort). (analysis_md, analysis_json, elapsed)를 반환합니다."""
+
+    report_t0 = time.time()
+    agent = _with_prompt_cache_key(
+        report_agent.clone(model=model) if model else report_agent, ctx.user_id
+    )
+    try:
+        report_run = await Runner.run(agent, _json_dumps(report_input), context=ctx)
+        narrative = report_run.final_output_as(FinalNarrative)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # 리포트 생성은 best-effort: 실패해도 백테스트 결과는 completed로 적재합니다.
+        return None, None, None
+
+    analysis_json: Dict[str, Any] = {}
+    for item in getattr(narrative, "analysis_json", []) or []:
+        k = getattr(item, "key", None)
+        v = getattr(item, "value", None)
+        if isinstance(k, str) and k.strip():
+            analysis_json[k.strip()] = v
+    return narrative.analysis_md, analysis_json, time.time() - report_t0
+
+
+async def _prefetch_symbols(
+    *, corp_names: list[str], query: str
+) -> Optional[Dict[str, Any]]:
+    """resolve_symbols_impl 선행 실행. 실패는 삼키고 None(본 경로에서 다시 조회)."""
+
+    try:
+        return await asyncio.to_thread(
+            _get_tools().resolve_symbols_impl, corp_names=corp_names, query=query
+        )
+    except Exception:
+        return None
+
+
+async def _cancel_task(task: Optional[asyncio.Task[Any]]) -> None:
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
 
 
 async def process_job(job: Dict[str, Any]) -> None:
@@ -297,14 +530,15 @@ async def process_job(job: Dict[str, Any]) -> None:
 
     if isinstance(payload, str):
         try:
-            payload = json.loads(payload)
+            payload = orjson.loads(payload)
         except Exception:
             payload = {}
     if not isinstance(payload, dict):
         payload = {}
 
-    max_retries = int(os.getenv("BACKTEST_AGENT_MAX_RETRIES", "2") or 2)
-    prompt_version = os.getenv("BACKTEST_AGENT_PROMPT_VERSION", "v1") or "v1"
+    max_retries = _MAX_RETRIES
+    speculative_report = _SPECULATIVE_REPORT
+    prompt_version = _PROMPT_VERSION
 
     ctx = BacktestAgentContext(job_id=job_id, user_id=user_id, prompt_version=prompt_version)
 
@@ -313,6 +547,8 @@ async def process_job(job: Dict[str, Any]) -> None:
     try:
         if not (os.getenv("OPENAI_API_KEY") or "").strip():
             raise RuntimeError("OPENAI_API_KEY가 설정되어 있지 않습니다. (Agents-only worker)")
+        # tools import 실패도 아래 except에서 failed로 적재되도록 try 안에서 로드
+        tools = _get_tools()
 
         with trace(
             "Stockelper Backtesting Agent",
@@ -326,11 +562,37 @@ async def process_job(job: Dict[str, Any]) -> None:
 
             need_parse = bool(query and query.strip())
             if need_parse:
-                parse_input = {"payload": payload}
-                parse_result = await Runner.run(
-                    parse_request_agent, _json_dumps(parse_input), context=ctx
+                # 파서가 채울 수 있는 필드가 payload에 모두 결정적으로 주어졌다면 파서는 보탤 것이 없으므로 생략
+                # (하나라도 비어 있으면 query에 적힌 초기 자본/리밸런싱 주기 등을 놓치지 않도록 파싱)
+                prelim = _apply_param_guardrails(_merge_backtest_params(payload=payload, parsed=None))
+                if all(prelim.get(k) for k in _PARSE_REQUIRED_FIELDS) and all(
+                    prelim.get(k) is not None for k in _PARSE_OPTIONAL_FIELDS
+                ):
+                    need_parse = False
+                    logger.info("job %s: payload가 파서 필드를 모두 채워 LLM 파싱을 생략합니다", job_id)
+            parse_task: asyncio.Task[ParsedRequest] | None = None
+            if need_parse:
+                # LLM 파싱은 먼저 띄워두고, 그 사이 결정적(비-LLM) 전처리를 진행합니다.
+                parse_task = asyncio.create_task(
+                    _parse_request(
+                        payload, prompt_version=prompt_version, user_id=user_id, ctx=ctx
+                    )
                 )
-                parsed = parse_result.final_output_as(ParsedRequest)
+
+            # query 기반 회사명 후보(LLM 파서가 corp_names를 못 뽑을 때 보강용)
+            query_corp_names = _extract_corp_names_from_query(query) if query else []
+
+            # 종목 해석(DB)을 파싱(LLM)과 겹쳐 미리 시작. 최종 회사명 후보가 달라지면 버립니다.
+            resolve_task: asyncio.Task[Optional[Dict[str, Any]]] | None = None
+            if query and not _merge_backtest_params(payload=payload, parsed=None).get(
+                "target_symbols"
+            ):
+                resolve_task = asyncio.create_task(
+                    _prefetch_symbols(corp_names=query_corp_names, query=query)
+                )
+
+            if parse_task is not None:
+                parsed = await parse_task
 
             # 2) BacktestInput dict 구성
             backtest_params = _merge_backtest_params(payload=payload, parsed=parsed)
@@ -338,7 +600,7 @@ async def process_job(job: Dict[str, Any]) -> None:
             backtest_params = _maybe_apply_years_range_from_query(backtest_params, query)
 
             # 3) 종목 해석/보강(회사명/쿼리 -> 종목코드)
-            allow_full = _to_bool(os.getenv("ALLOW_FULL_UNIVERSE"), default=False)
+            allow_full = _ALLOW_FULL
 
             target_symbols = backtest_params.get("target_symbols") or []
             target_corp_names = backtest_params.get("target_corp_names") or []
@@ -349,15 +611,24 @@ async def process_job(job: Dict[str, Any]) -> None:
 
             # LLM 파서가 corp_names를 못 뽑아도, query 기반으로 후보를 보강
             if not target_corp_names and query:
-                target_corp_names = _extract_corp_names_from_query(query)
+                target_corp_names = query_corp_names
 
             if (not target_symbols) and (target_corp_names or query):
-                resolved = resolve_symbols_impl(corp_names=target_corp_names, query=query)
+                resolved = None
+                if resolve_task is not None and target_corp_names == query_corp_names:
+                    resolved = await resolve_task
+                    resolve_task = None
+                if resolved is None:
+                    resolved = await asyncio.to_thread(
+                        tools.resolve_symbols_impl, corp_names=target_corp_names, query=query
+                    )
                 resolved_symbols = resolved.get("symbols") or []
                 if resolved_symbols:
                     backtest_params["target_symbols"] = resolved_symbols
                     target_symbols = resolved_symbols
 
+            await _cancel_task(resolve_task)
+
             if not allow_full and not target_symbols:
                 raise ValueError(
                     "백테스트 대상 종목을 찾을 수 없습니다. "
@@ -371,10 +642,13 @@ async def process_job(job: Dict[str, Any]) -> None:
             last_audit: AuditResult | None = None
             output_dict: Dict[str, Any] | None = None
             output_summary: Dict[str, Any] | None = None
+            report_task: asyncio.Task[Any] | None = None
+            adjust_memo: Dict[str, AdjustmentPlan] = {}
+            seen_preflights: set[str] = set()
 
             while True:
                 # 4-1) Preflight
-                preflight_dict = preflight_data_check_impl(backtest_params=backtest_params)
+                preflight_dict = await tools.preflight_data_check_impl(backtest_params=backtest_params)
                 last_preflight = PreflightReport.model_validate(preflight_dict)
 
                 if not last_preflight.ok:
@@ -382,36 +656,79 @@ async def process_job(job: Dict[str, Any]) -> None:
                         raise ValueError(
                             f"사전 점검 실패: {last_preflight.warnings} (retries={retry_count})"
                         )
-                    adjust_input = {
-                        "stage": "preflight",
-                        "backtest_params": backtest_params,
-                        "preflight_report": last_preflight.model_dump(),
-                        "audit_feedback": None,
-                    }
-                    adj_run = await Runner.run(
-                        adjust_plan_agent, _json_dumps(adjust_input), context=ctx
+                    # 같은 점검 결과가 재발하면(수정안이 효과 없음) 더 돌려도 수렴하지 않으므로 중단
+                    preflight_key = _json_dumps(last_preflight.model_dump())
+                    if preflight_key in seen_preflights:
+                        raise ValueError(
+                            f"사전 점검 실패가 수정 후에도 동일하게 반복됩니다: {last_preflight.warnings}"
+                        )
+                    seen_preflights.add(preflight_key)
+                    adj_stage = "preflight"
+                    adj = await _plan_adjustment(
+                        stage=adj_stage,
+                        backtest_params=backtest_params,
+                        preflight=last_preflight,
+                        audit=None,
+                        ctx=ctx,
+                        memo=adjust_memo,
                     )
-                    adj = adj_run.final_output_as(AdjustmentPlan)
+                    before = dict(backtest_params)
                     backtest_params = _apply_adjustment(backtest_params, adj)
                     backtest_params = _apply_param_guardrails(backtest_params)
+                    if backtest_params == before:
+                        raise ValueError(
+                            f"수정안이 파라미터를 바꾸지 않아 재시도를 중단합니다(stage={adj_stage})"
+                        )
                     retry_count += 1
                     continue
 
                 # 4-2) Run backtest
-                output_dict = await run_backtest_impl(backtest_params=backtest_params)
-                output_summary = _build_output_summary(output_dict)
+                output_dict = await tools.run_backtest_impl(backtest_params=backtest_params)
+                output_summary = tools.build_output_summary(output_dict)
+
+                report_model = _pick_report_model(output_summary)
+
+                # 4-3) (옵션) Report 선행 실행: audit 결과 없이 요약/거래만으로 해석을 생성
+                if speculative_report:
+                    report_task = asyncio.create_task(
+                        _run_report(
+                            _build_report_input(
+                                backtest_params=backtest_params,
+                                preflight=last_preflight,
+                                audit=None,
+                                output_summary=output_summary,
+                                output_dict=output_dict,
+                            ),
+                            ctx=ctx,
+                            model=report_model,
+                        )
+                    )
 
                 # 4-4) Audit
                 audit_input = {
                     "backtest_params": backtest_params,
-                    "preflight_report": last_preflight.model_dump(),
+                    "preflight_report": _preflight_brief(last_preflight),
                     "output_summary": output_summary,
-                    "trades_head": (output_dict.get("trades") or [])[:50],
+                    "trades_head": _project_trades(
+                        output_dict.get("trades"),
+                        _TRADES_HEAD,
+                    ),
                 }
-                audit_run = await Runner.run(
-                    audit_result_agent, _json_dumps(audit_input), context=ctx
-                )
-                last_audit = audit_run.final_output_as(AuditResult)
+                try:
+                    audit_run = await Runner.run(
+                        _with_prompt_cache_key(audit_result_agent, user_id),
+                        _json_dumps(audit_input),
+                        context=ctx,
+                    )
+                    last_audit = audit_run.final_output_as(AuditResult)
+                except BaseException:
+                    await _cancel_task(report_task)
+                    raise
+
+                if last_audit.score == "fail" or last_audit.needs_retry:
+                    # 선행 실행한 report는 폐기
+                    await _cancel_task(report_task)
+                    report_task = None
 
                 if last_audit.score == "fail":
                     raise ValueError(f"Audit fail: {last_audit.feedback}")
@@ -422,18 +739,22 @@ async def process_job(job: Dict[str, Any]) -> None:
                         raise ValueError(
                             f"Audit requested retry but retry budget exhausted: {last_audit.feedback}"
                         )
-                    adjust_input = {
-                        "stage": "audit",
-                        "backtest_params": backtest_params,
-                        "preflight_report": last_preflight.model_dump(),
-                        "audit_feedback": last_audit.model_dump(),
-                    }
-                    adj_run = await Runner.run(
-                        adjust_plan_agent, _json_dumps(adjust_input), context=ctx
+                    adj_stage = "audit"
+                    adj = await _plan_adjustment(
+                        stage=adj_stage,
+                        backtest_params=backtest_params,
+                        preflight=last_preflight,
+                        audit=last_audit,
+                        ctx=ctx,
+                        memo=adjust_memo,
                     )
-                    adj = adj_run.final_output_as(AdjustmentPlan)
+                    before = dict(backtest_params)
                     backtest_params = _apply_adjustment(backtest_params, adj)
                     backtest_params = _apply_param_guardrails(backtest_params)
+                    if backtest_params == before:
+                        raise ValueError(
+                            f"수정안이 파라미터를 바꾸지 않아 재시도를 중단합니다(stage={adj_stage})"
+                        )
                     retry_count += 1
                     continue
 
@@ -445,41 +766,35 @@ async def process_job(job: Dict[str, Any]) -> None:
             assert last_audit is not None
 
             # 5) 최종 artifact 작성(통과 후에만 저장하여 실패 시 찌꺼기 최소화)
-            from backtesting.agents.tools import build_artifacts_impl
-
-            artifacts = build_artifacts_impl(job_id=job_id, output_dict=output_dict)
-            files = artifacts.get("files") or {}
+            #    파일 쓰기는 스레드로 넘겨 리포트(LLM) 호출과 겹쳐 실행합니다.
+            artifacts_task = asyncio.create_task(
+                asyncio.to_thread(
+                    tools.build_artifacts_impl,
+                    job_id=job_id,
+                    output_dict=output_dict,
+                    summary=output_summary,
+                )
+            )
 
             # 5) Report(해석)
-            report_t0 = time.time()
-            report_input = {
-                "backtest_params": backtest_params,
-                "preflight_report": last_preflight.model_dump(),
-                "audit_result": last_audit.model_dump(),
-                "output_summary": output_summary,
-                "trades_head": (output_dict.get("trades") or [])[:200],
-            }
-            analysis_md: Optional[str] = None
-            analysis_json_dict: Optional[Dict[str, Any]] = None
-            report_elapsed: Optional[float] = None
-            try:
-                report_run = await Runner.run(report_agent, _json_dumps(report_input), context=ctx)
-                narrative = report_run.final_output_as(FinalNarrative)
-                report_elapsed = time.time() - report_t0
-
-                analysis_md = narrative.analysis_md
-                analysis_json_dict2: Dict[str, Any] = {}
-                for item in getattr(narrative, "analysis_json", []) or []:
-                    k = getattr(item, "key", None)
-                    v = getattr(item, "value", None)
-                    if isinstance(k, str) and k.strip():
-                        analysis_json_dict2[k.strip()] = v
-                analysis_json_dict = analysis_json_dict2
-            except Exception:
-                # 리포트 생성은 best-effort: 실패해도 백테스트 결과는 completed로 적재합니다.
-                analysis_md = None
-                analysis_json_dict = None
-                report_elapsed = None
+            if report_task is None:
+                report_task = asyncio.create_task(
+                    _run_report(
+                        _build_report_input(
+                            backtest_params=backtest_params,
+                            preflight=last_preflight,
+                            audit=last_audit,
+                            output_summary=output_summary,
+                            output_dict=output_dict,
+                        ),
+                        ctx=ctx,
+                        model=report_model,
+                    )
+                )
+            analysis_md, analysis_json_dict, report_elapsed = await report_task
+
+            artifacts = await artifacts_task
+            files = artifacts.get("files") or {}
 
             # 6) Persist
             elapsed = time.time() - t0
@@ -491,7 +806,7 @@ async def process_job(job: Dict[str, Any]) -> None:
                 elapsed_seconds=elapsed,
                 analysis_md=analysis_md,
                 analysis_json=analysis_json_dict,
-                analysis_model=os.getenv("BACKTEST_AGENT_MODEL_REPORT") or None,
+                analysis_model=report_model or None,
                 analysis_prompt_version=prompt_version,
                 analysis_elapsed_seconds=report_elapsed,
             )
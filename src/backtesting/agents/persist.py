@@ -0,0 +1,46 @@
+"""job 결과 DB 적재 도구.
+
+web_db(asyncpg)만 의존하므로 orchestrator가 바로 import할 수 있습니다. tools(portfolio_backtest)
+import가 실패해도 job을 failed로 남길 수 있도록 tools와 분리해 둡니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from backtesting.web_db import mark_job_completed_with_analysis, mark_job_failed
+
+
+async def persist_completed_impl(
+    *,
+    job_id: str,
+    output_json: Dict[str, Any],
+    result_file_path: Optional[str],
+    report_file_path: Optional[str],
+    elapsed_seconds: Optional[float],
+    analysis_md: Optional[str],
+    analysis_json: Optional[Dict[str, Any]],
+    analysis_model: Optional[str],
+    analysis_prompt_version: Optional[str],
+    analysis_elapsed_seconds: Optional[float],
+) -> bool:
+    return await mark_job_completed_with_analysis(
+        job_id=job_id,
+        output_json=output_json,
+        result_file_path=result_file_path,
+        report_file_path=report_file_path,
+        elapsed_seconds=elapsed_seconds,
+        analysis_md=analysis_md,
+        analysis_json=analysis_json,
+        analysis_model=analysis_model,
+        analysis_prompt_version=analysis_prompt_version,
+        analysis_elapsed_seconds=analysis_elapsed_seconds,
+    )
+
+
+async def persist_failed_impl(
+    *, job_id: str, error_message: str, elapsed_seconds: Optional[float]
+) -> bool:
+    return await mark_job_failed(
+        job_id=job_id, error_message=str(error_message), elapsed_seconds=elapsed_seconds
+    )
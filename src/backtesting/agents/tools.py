@@ -1,21 +1,56 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import copy
+import heapq
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from sqlalchemy import text
 
+from backtesting.agents.cache import (
+    PREFLIGHT_CACHE_TTL_SECONDS,
+    RESOLVE_SYMBOLS_CACHE_TTL_SECONDS,
+    preflight_cache,
+    resolve_symbols_cache,
+)
 from backtesting.agents.schemas import (
     DartCoverage,
     PreflightReport,
     PriceCoverage,
 )
+from backtesting.agents.persist import persist_completed_impl, persist_failed_impl  # noqa: F401
 from backtesting.portfolio_backtest import BacktestInput, DataLoader, run_backtest
-from backtesting.web_db import mark_job_completed_with_analysis, mark_job_failed
+
+
+_SIX_DIGIT_RE = re.compile(r"\b\d{6}\b")
+_TOKEN_RE = re.compile(r"[가-힣A-Za-z]{2,}")
+# 종목 검색 토큰에서 제외할 요청/도메인 일반어
+_STOPWORDS = frozenset(
+    {
+        "백테스트",
+        "백테스팅",
+        "backtest",
+        "backtesting",
+        "기간",
+        "수익률",
+        "전략",
+        "리밸런싱",
+        "포트폴리오",
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _default_loader() -> DataLoader:
+    """DB_* env 기반 기본 DataLoader(엔진/커넥션 풀 공유)."""
+
+    return DataLoader(BacktestInput())
 
 
 def _safe_date_str(v: Any) -> Optional[str]:
@@ -29,62 +64,93 @@ def _safe_date_str(v: Any) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=4096)
+def _is_valid_symbol(s: str) -> bool:
+    # isdigit()은 전각/유니코드 숫자도 허용하므로 ASCII로 한정(둘 다 C 레벨 검사)
+    return len(s) == 6 and s.isascii() and s.isdigit()
+
+
 def _normalize_symbol(x: Any) -> Optional[str]:
     if not isinstance(x, str):
         return None
     s = x.strip()
-    if len(s) == 6 and s.isdigit():
-        return s
-    return None
+    return s if _is_valid_symbol(s) else None
+
+
+# BacktestOutput 요약 필드(_output_to_dict/build_output_summary 공용)
+_FLOAT_FIELDS = (
+    "total_return",
+    "annualized_return",
+    "mdd",
+    "sharpe_ratio",
+    "win_rate",
+    "total_profit",
+    "total_loss",
+)
+_INT_FIELDS = ("total_trades",)
+
+
+def _safe_float(x: Any) -> Optional[float]:
+    try:
+        return None if x is None else float(x)
+    except Exception:
+        return None
+
+
+# (필드, 기본값, falsy 값을 기본값으로 대체할지) — 모듈 로드 시 한 번만 구성
+_OUTPUT_FIELDS: Tuple[Tuple[str, Any, bool], ...] = (
+    ("cumulative_return", 0.0, False),
+    *((k, 0.0, False) for k in _FLOAT_FIELDS),
+    *((k, 0, False) for k in _INT_FIELDS),
+    ("trades", [], True),
+    ("event_performance", {}, True),
+    ("report", "", True),
+)
 
 
 def _output_to_dict(output: Any) -> Dict[str, Any]:
-    return {
-        "cumulative_return": getattr(output, "cumulative_return", 0.0),
-        "total_return": getattr(output, "total_return", 0.0),
-        "annualized_return": getattr(output, "annualized_return", 0.0),
-        "mdd": getattr(output, "mdd", 0.0),
-        "sharpe_ratio": getattr(output, "sharpe_ratio", 0.0),
-        "win_rate": getattr(output, "win_rate", 0.0),
-        "total_trades": getattr(output, "total_trades", 0),
-        "total_profit": getattr(output, "total_profit", 0.0),
-        "total_loss": getattr(output, "total_loss", 0.0),
-        "trades": getattr(output, "trades", []) or [],
-        "event_performance": getattr(output, "event_performance", {}) or {},
-        "report": getattr(output, "report", "") or "",
-    }
+    d: Dict[str, Any] = {}
+    for k, default, or_default in _OUTPUT_FIELDS:
+        v = getattr(output, k, default)
+        if or_default and not v:
+            # 가변 기본값([]/{})은 호출마다 새 객체로
+            v = type(default)()
+        d[k] = v
+    return d
 
 
-def _build_output_summary(output_dict: Dict[str, Any]) -> Dict[str, Any]:
-    def _f(x: Any) -> Optional[float]:
-        try:
-            return None if x is None else float(x)
-        except Exception:
-            return None
-
-    return {
-        "total_return": _f(output_dict.get("total_return")),
-        "annualized_return": _f(output_dict.get("annualized_return")),
-        "mdd": _f(output_dict.get("mdd")),
-        "sharpe_ratio": _f(output_dict.get("sharpe_ratio")),
-        "win_rate": _f(output_dict.get("win_rate")),
-        "total_trades": int(output_dict.get("total_trades") or 0),
-        "total_profit": _f(output_dict.get("total_profit")),
-        "total_loss": _f(output_dict.get("total_loss")),
-    }
+def build_output_summary(output_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """백테스트 결과 dict에서 DB output_json/에이전트 입력용 성과 요약을 만듭니다."""
 
+    summary: Dict[str, Any] = {k: _safe_float(output_dict.get(k)) for k in _FLOAT_FIELDS}
+    for k in _INT_FIELDS:
+        summary[k] = int(output_dict.get(k) or 0)
+    return summary
 
-def _write_artifacts(*, job_id: str, output_dict: Dict[str, Any]) -> Dict[str, str]:
+
+def _results_dir() -> Path:
     out_dir = Path(os.getenv("BACKTEST_RESULTS_DIR", "outputs/backtesting_results")).resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
+    return out_dir
+
+
+def _write_artifacts(*, job_id: str, output_dict: Dict[str, Any]) -> Dict[str, str]:
+    out_dir = _results_dir()
 
     json_path = out_dir / f"{job_id}.json"
     md_path = out_dir / f"{job_id}.md"
 
-    json_path.write_text(
-        json.dumps(output_dict, ensure_ascii=False, indent=2), encoding="utf-8"
+    # orjson은 UTF-8 bytes를 바로 만들어 str 중간 생성/인코딩 없이 기록합니다.
+    json_path.write_bytes(
+        orjson.dumps(
+            output_dict,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+            default=str,
+        )
     )
-    md_path.write_text(str(output_dict.get("report") or ""), encoding="utf-8")
+    md_path.write_bytes(str(output_dict.get("report") or "").encode("utf-8"))
 
     return {"result_file_path": str(json_path), "report_file_path": str(md_path)}
 
@@ -94,81 +160,111 @@ def resolve_symbols_impl(
     corp_names: Optional[List[str]] = None,
     query: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """회사명/자연어에서 종목코드를 조회해 반환합니다(score_table_dart_idc 기반)."""
+    """회사명/자연어에서 종목코드를 조회해 반환합니다(score_table_dart_idc 기반).
+
+    재시도/재요청에서 같은 입력이 반복되므로 결과를 TTL 캐시에 보관합니다.
+    """
 
-    base_input = BacktestInput()  # DB_* env 기반
-    loader = DataLoader(base_input)
+    names = {n.strip() for n in (corp_names or []) if isinstance(n, str) and n.strip()}
+    cache_key = (tuple(sorted(names)), query.strip() if isinstance(query, str) else "")
+    cached = resolve_symbols_cache.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
 
-    resolved: List[str] = []
+    result = _resolve_symbols_uncached(corp_names=corp_names, query=query)
+    resolve_symbols_cache.setex(cache_key, RESOLVE_SYMBOLS_CACHE_TTL_SECONDS, result)
+    return copy.deepcopy(result)
+
+
+def _resolve_symbols_uncached(
+    *,
+    corp_names: Optional[List[str]],
+    query: Optional[str],
+) -> Dict[str, Any]:
+    loader = _default_loader()
+
+    # 검증을 통과한 코드만 담으므로 마지막에 재검증하지 않습니다.
+    resolved: set[str] = set()
     mapping_log: Dict[str, Any] = {"by_corp_name": {}, "by_query_tokens": {}}
 
-    # 1) corp_names exact match 우선
-    if corp_names:
-        for name in corp_names:
-            if not isinstance(name, str) or not name.strip():
-                continue
-            corp_name = name.strip()
-            with loader.pg_engine.connect() as conn:
-                res = conn.execute(
-                    text(
-                        """
-                        SELECT DISTINCT stock_code
-                        FROM score_table_dart_idc
-                        WHERE corp_name = :corp_name
-                        ORDER BY stock_code
-                        LIMIT 5
-                        """
-                    ),
-                    {"corp_name": corp_name},
-                )
-                rows = [r[0] for r in res.fetchall() if r and r[0]]
-                mapping_log["by_corp_name"][corp_name] = rows
-                resolved.extend([s for s in rows if _normalize_symbol(s)])
+    # 1) corp_names exact match 대상
+    exact_names = list(
+        dict.fromkeys(n.strip() for n in (corp_names or []) if isinstance(n, str) and n.strip())
+    )
 
-    # 2) query에서 6자리 종목코드 직접 추출
+    tokens: List[str] = []
     if query and isinstance(query, str):
-        found = re.findall(r"\b\d{6}\b", query)
-        resolved.extend([s for s in found if _normalize_symbol(s)])
+        # 2) query에서 6자리 종목코드 직접 추출
+        found = _SIX_DIGIT_RE.findall(query)
+        resolved.update(s for s in found if _is_valid_symbol(s))
 
         # 3) query 토큰으로 ILIKE 검색(최대 5개 토큰)
-        tokens = re.findall(r"[가-힣A-Za-z]{2,}", query)
-        stop = {
-            "백테스트",
-            "백테스팅",
-            "backtest",
-            "backtesting",
-            "기간",
-            "수익률",
-            "전략",
-            "리밸런싱",
-            "포트폴리오",
-        }
-        tokens = [t for t in tokens if t and t.lower() not in stop]
-        tokens = sorted(set(tokens), key=len, reverse=True)[:5]
-        if tokens:
-            with loader.pg_engine.connect() as conn:
-                for tok in tokens:
-                    res = conn.execute(
-                        text(
-                            """
-                            SELECT DISTINCT stock_code
-                            FROM score_table_dart_idc
-                            WHERE corp_name ILIKE :pattern
-                            ORDER BY stock_code
-                            LIMIT 5
-                            """
-                        ),
-                        {"pattern": f"%{tok}%"},
-                    )
-                    rows = [r[0] for r in res.fetchall() if r and r[0]]
-                    mapping_log["by_query_tokens"][tok] = rows
-                    resolved.extend([s for s in rows if _normalize_symbol(s)])
-
-    unique = sorted(set([s for s in resolved if _normalize_symbol(s)]))
+        # 긴 토큰 상위 5개만 필요하므로 전체 정렬 대신 heap으로 선택
+        # 한글 토큰은 lower()가 무의미하므로 ASCII 토큰만 소문자화해 비교
+        tokens = heapq.nlargest(
+            5,
+            {
+                t
+                for t in _TOKEN_RE.findall(query)
+                if (t.lower() if t.isascii() else t) not in _STOPWORDS
+            },
+            key=len,
+        )
+
+    for name in exact_names:
+        mapping_log["by_corp_name"][name] = []
+    for tok in tokens:
+        mapping_log["by_query_tokens"][tok] = []
+
+    if exact_names or tokens:
+        # exact/ILIKE 검색을 한 번의 쿼리로 묶고, (검색 종류, 키)별 상위 5개만 유지
+        q = text(
+            """
+            SELECT src, key, stock_code
+            FROM (
+              SELECT src, key, stock_code,
+                     ROW_NUMBER() OVER (PARTITION BY src, key ORDER BY stock_code) AS rn
+              FROM (
+                (
+                  SELECT DISTINCT 'exact' AS src, corp_name AS key, stock_code
+                  FROM score_table_dart_idc
+                  WHERE corp_name = ANY(:exact_names)
+                )
+                UNION ALL
+                (
+                  SELECT DISTINCT 'token' AS src, t.tok AS key, d.stock_code
+                  FROM score_table_dart_idc d
+                  JOIN unnest(CAST(:tokens AS text[])) AS t(tok)
+                    ON d.corp_name ILIKE '%' || t.tok || '%'
+                )
+              ) u
+              WHERE stock_code IS NOT NULL
+            ) ranked
+            WHERE rn <= 5
+            ORDER BY src, key, stock_code
+            """
+        )
+        with loader.pg_engine.connect() as conn:
+            rows = conn.execute(q, {"exact_names": exact_names, "tokens": tokens}).fetchall()
+
+        for src, key, code in rows:
+            bucket = "by_corp_name" if src == "exact" else "by_query_tokens"
+            mapping_log[bucket].setdefault(key, []).append(code)
+            if isinstance(code, str) and _is_valid_symbol(code):
+                resolved.add(code)
+
+    unique = sorted(resolved)
     return {"symbols": unique, "mapping_log": mapping_log}
 
 
-def preflight_data_check_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, Any]:
+def _fetch_rows_by_key(engine: Any, query: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    """첫 컬럼을 키로 하는 {key: row} 조회(스레드에서 실행)."""
+
+    with engine.connect() as conn:
+        return {r[0]: r for r in conn.execute(query, params).fetchall()}
+
+
+async def preflight_data_check_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, Any]:
     """백테스트 실행 전, 가격/공시 데이터 커버리지를 빠르게 점검합니다."""
 
     # BacktestInput 검증(여기서 터지면 상위에서 처리)
@@ -182,6 +278,17 @@ def preflight_data_check_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, A
         )
         return report.model_dump()
 
+    # 같은 (종목, 기간, 공시 사용 여부) 점검은 과거 구간이라 짧은 TTL 동안 결과가 변하지 않음
+    cache_key = (
+        frozenset(_normalize_symbol(s) or str(s) for s in symbols),
+        bt.start_date,
+        bt.end_date,
+        bool(bt.use_dart_disclosure),
+    )
+    cached = preflight_cache.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
     loader = DataLoader(bt)
     start_date = bt.start_date
     end_date = bt.end_date
@@ -194,57 +301,77 @@ def preflight_data_check_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, A
     min_dates: List[str] = []
     max_dates: List[str] = []
 
-    with loader.pg_engine.connect() as conn:
-        for sym in symbols:
-            sym_n = _normalize_symbol(sym) or str(sym)
-
-            q_price = text(
-                """
-                SELECT COUNT(*) AS cnt, MIN(date) AS min_date, MAX(date) AS max_date
-                FROM daily_stock_price
-                WHERE symbol = :symbol
-                  AND date >= :start_date
-                  AND date <= :end_date
-                """
+    # 종목별 루프 대신 테이블당 1회 GROUP BY 집계(N회 왕복 -> 1회)
+    syms = list(dict.fromkeys(_normalize_symbol(s) or str(s) for s in symbols))
+    q_price = text(
+        """
+        SELECT symbol, COUNT(*) AS cnt, MIN(date) AS min_date, MAX(date) AS max_date
+        FROM daily_stock_price
+        WHERE symbol = ANY(:symbols)
+          AND date >= :start_date
+          AND date <= :end_date
+        GROUP BY symbol
+        """
+    )
+    q_dart = text(
+        """
+        SELECT stock_code, COUNT(*) AS cnt, MIN(rcept_dt) AS min_date, MAX(rcept_dt) AS max_date
+        FROM score_table_dart_idc
+        WHERE stock_code = ANY(:symbols)
+          AND rcept_dt >= :start_date
+          AND rcept_dt <= :end_date
+        GROUP BY stock_code
+        """
+    )
+
+    # 두 집계는 서로 독립이므로 풀에서 각각 커넥션을 받아 동시에 실행
+    price_fetch = asyncio.to_thread(
+        _fetch_rows_by_key,
+        loader.pg_engine,
+        q_price,
+        {"symbols": syms, "start_date": start_date, "end_date": end_date},
+    )
+    if bt.use_dart_disclosure:
+        dart_fetch = asyncio.to_thread(
+            _fetch_rows_by_key,
+            loader.pg_engine,
+            q_dart,
+            {
+                "symbols": syms,
+                "start_date": datetime.strptime(start_date, "%Y-%m-%d").date(),
+                "end_date": datetime.strptime(end_date, "%Y-%m-%d").date(),
+            },
+        )
+        price_rows, dart_rows = await asyncio.gather(price_fetch, dart_fetch)
+    else:
+        price_rows, dart_rows = await price_fetch, {}
+
+    for sym_n in syms:
+        r = price_rows.get(sym_n)
+        cnt = int(r[1] or 0) if r else 0
+        mn = _safe_date_str(r[2]) if r else None
+        mx = _safe_date_str(r[3]) if r else None
+
+        # 내부에서 정규화한 값이므로 pydantic 검증 없이 생성(model_construct)
+        price[sym_n] = PriceCoverage.model_construct(
+            symbol=sym_n, rows=cnt, min_date=mn, max_date=mx
+        )
+        if cnt <= 0:
+            missing_price.append(sym_n)
+        else:
+            if mn:
+                min_dates.append(mn)
+            if mx:
+                max_dates.append(mx)
+
+        if bt.use_dart_disclosure:
+            rr = dart_rows.get(sym_n)
+            dcnt = int(rr[1] or 0) if rr else 0
+            dmn = _safe_date_str(rr[2]) if rr else None
+            dmx = _safe_date_str(rr[3]) if rr else None
+            dart[sym_n] = DartCoverage.model_construct(
+                symbol=sym_n, rows=dcnt, min_date=dmn, max_date=dmx
             )
-            r = conn.execute(
-                q_price, {"symbol": sym_n, "start_date": start_date, "end_date": end_date}
-            ).fetchone()
-            cnt = int(r[0] or 0) if r else 0
-            mn = _safe_date_str(r[1]) if r else None
-            mx = _safe_date_str(r[2]) if r else None
-
-            price[sym_n] = PriceCoverage(symbol=sym_n, rows=cnt, min_date=mn, max_date=mx)
-            if cnt <= 0:
-                missing_price.append(sym_n)
-            else:
-                if mn:
-                    min_dates.append(mn)
-                if mx:
-                    max_dates.append(mx)
-
-            if bt.use_dart_disclosure:
-                q_dart = text(
-                    """
-                    SELECT COUNT(*) AS cnt, MIN(rcept_dt) AS min_date, MAX(rcept_dt) AS max_date
-                    FROM score_table_dart_idc
-                    WHERE stock_code = :symbol
-                      AND rcept_dt >= :start_date
-                      AND rcept_dt <= :end_date
-                    """
-                )
-                rr = conn.execute(
-                    q_dart,
-                    {
-                        "symbol": sym_n,
-                        "start_date": datetime.strptime(start_date, "%Y-%m-%d").date(),
-                        "end_date": datetime.strptime(end_date, "%Y-%m-%d").date(),
-                    },
-                ).fetchone()
-                dcnt = int(rr[0] or 0) if rr else 0
-                dmn = _safe_date_str(rr[1]) if rr else None
-                dmx = _safe_date_str(rr[2]) if rr else None
-                dart[sym_n] = DartCoverage(symbol=sym_n, rows=dcnt, min_date=dmn, max_date=dmx)
 
     suggested_start: Optional[str] = None
     suggested_end: Optional[str] = None
@@ -262,8 +389,8 @@ def preflight_data_check_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, A
     if missing_price:
         warnings.append(f"가격 데이터가 없는 종목이 있습니다: {missing_price}")
 
-    report = PreflightReport(
-        ok=(len(missing_price) < len(symbols)),
+    report = PreflightReport.model_construct(
+        ok=(len(missing_price) < len(syms)),
         warnings=warnings,
         suggested_start_date=suggested_start,
         suggested_end_date=suggested_end,
@@ -271,7 +398,9 @@ def preflight_data_check_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, A
         price=price,
         dart=dart,
     )
-    return report.model_dump()
+    result = report.model_dump()
+    preflight_cache.setex(cache_key, PREFLIGHT_CACHE_TTL_SECONDS, result)
+    return copy.deepcopy(result)
 
 
 async def run_backtest_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, Any]:
@@ -280,43 +409,15 @@ async def run_backtest_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, Any
     return _output_to_dict(output)
 
 
-def build_artifacts_impl(*, job_id: str, output_dict: Dict[str, Any]) -> Dict[str, Any]:
-    files = _write_artifacts(job_id=job_id, output_dict=output_dict)
-    summary = _build_output_summary(output_dict)
-    return {"files": files, "summary": summary}
-
-
-async def persist_completed_impl(
+def build_artifacts_impl(
     *,
     job_id: str,
-    output_json: Dict[str, Any],
-    result_file_path: Optional[str],
-    report_file_path: Optional[str],
-    elapsed_seconds: Optional[float],
-    analysis_md: Optional[str],
-    analysis_json: Optional[Dict[str, Any]],
-    analysis_model: Optional[str],
-    analysis_prompt_version: Optional[str],
-    analysis_elapsed_seconds: Optional[float],
-) -> bool:
-    return await mark_job_completed_with_analysis(
-        job_id=job_id,
-        output_json=output_json,
-        result_file_path=result_file_path,
-        report_file_path=report_file_path,
-        elapsed_seconds=elapsed_seconds,
-        analysis_md=analysis_md,
-        analysis_json=analysis_json,
-        analysis_model=analysis_model,
-        analysis_prompt_version=analysis_prompt_version,
-        analysis_elapsed_seconds=analysis_elapsed_seconds,
-    )
-
-
-async def persist_failed_impl(
-    *, job_id: str, error_message: str, elapsed_seconds: Optional[float]
-) -> bool:
-    return await mark_job_failed(
-        job_id=job_id, error_message=str(error_message), elapsed_seconds=elapsed_seconds
-    )
+    output_dict: Dict[str, Any],
+    summary: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """결과 파일을 쓰고 요약과 함께 반환합니다(호출자가 이미 만든 요약이 있으면 재사용)."""
 
+    files = _write_artifacts(job_id=job_id, output_dict=output_dict)
+    if summary is None:
+        summary = build_output_summary(output_dict)
+    return {"files": files, "summary": summary}
@@ -47,18 +47,25 @@
 import backtrader as bt
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 import time
 import os
+import re
 from dotenv import load_dotenv
 import asyncio
 import json
+import logging
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # ============================================================
 # 유틸: 날짜/필터링
 # ============================================================
@@ -66,6 +73,25 @@ def _to_datetime(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%Y-%m-%d")
 
 
+@lru_cache(maxsize=1024)
+def _parse_date(date_str: str) -> date:
+    # 종목마다 같은 백테스트 기간 문자열을 반복 파싱하므로 결과를 캐시
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
+def _screening_window_start(start_date: str, end_date: str, lookback_days: int) -> str:
+    """스크리닝 점수 계산에 쓰는 lookback 윈도우 시작일(YYYY-MM-DD)."""
+    start_dt = _to_datetime(start_date)
+    end_dt = _to_datetime(end_date)
+    if end_dt < start_dt:
+        start_dt, end_dt = end_dt, start_dt
+    if lookback_days and lookback_days > 0:
+        window_start = max(start_dt, end_dt - timedelta(days=int(lookback_days)))
+    else:
+        window_start = start_dt
+    return window_start.strftime("%Y-%m-%d")
+
+
 def _apply_metric_filter_and_sort(
     symbol_to_score: Dict[str, float],
     *,
@@ -80,29 +106,51 @@ def _apply_metric_filter_and_sort(
       - "value": filter_value 기준으로 컷
       - "top"/"bottom": filter_percent(%) 기준으로 상/하위 컷
     """
-    items = [(sym, float(score)) for sym, score in symbol_to_score.items()]
+    if not symbol_to_score:
+        return []
+
+    syms = np.array(list(symbol_to_score.keys()), dtype=object)
+    vals = np.fromiter(
+        (float(v) for v in symbol_to_score.values()), dtype=np.float64, count=len(symbol_to_score)
+    )
 
     if filter_type == "value" and filter_value is not None:
-        if sort_ascending:
-            items = [(s, v) for s, v in items if v <= float(filter_value)]
-        else:
-            items = [(s, v) for s, v in items if v >= float(filter_value)]
+        mask = vals <= float(filter_value) if sort_ascending else vals >= float(filter_value)
+        syms, vals = syms[mask], vals[mask]
 
-    # 먼저 정렬(상/하위 컷을 위해)
-    items.sort(key=lambda x: x[1], reverse=not sort_ascending)
+    # 정렬 키: 동점은 입력 순서를 유지(stable), 내림차순은 부호 반전
+    key = vals if sort_ascending else -vals
 
     if filter_type in ("top", "bottom") and filter_percent is not None:
         p = max(0.0, min(100.0, float(filter_percent)))
         if p == 0.0:
             return []
-        k = max(1, int(round(len(items) * (p / 100.0))))
-        if filter_type == "top":
-            items = items[:k]
-        else:  # bottom
-            items = items[-k:]
+        k = max(1, int(round(len(key) * (p / 100.0))))
+        # 상/하위 k개만 필요하므로 전체 정렬 대신 부분 선택 후 k개만 정렬
+        order = _stable_select_k(key, k, from_end=(filter_type == "bottom"))
+    else:
+        order = np.argsort(key, kind="stable")
 
     # 최종은 정렬 상태 유지
-    return [s for s, _ in items]
+    return syms[order].tolist()
+
+
+def _stable_select_k(key: np.ndarray, k: int, *, from_end: bool) -> np.ndarray:
+    """`np.argsort(key, kind="stable")[:k]`(from_end면 `[-k:]`)와 동일한 결과를 O(n + k log k)로 계산."""
+    n = len(key)
+    if k >= n or np.isnan(key).any():
+        order = np.argsort(key, kind="stable")
+        return order[-k:] if from_end else order[:k]
+
+    # k번째 순서통계량을 경계값으로 잡고, 경계 동점은 stable 정렬과 같은 쪽(앞/뒤 인덱스)에서 채움
+    pivot = n - k if from_end else k - 1
+    thr = np.partition(key, pivot)[pivot]
+    strict = np.flatnonzero(key > thr if from_end else key < thr)
+    ties = np.flatnonzero(key == thr)
+    need = k - len(strict)
+    ties = ties[len(ties) - need :] if from_end else ties[:need]
+    sel = np.sort(np.concatenate([strict, ties]))
+    return sel[np.argsort(key[sel], kind="stable")]
 
 
 def _collapse_daily_disclosures(disclosure_df: pd.DataFrame) -> pd.DataFrame:
@@ -157,7 +205,7 @@ def _collapse_daily_disclosures(disclosure_df: pd.DataFrame) -> pd.DataFrame:
 # ============================================================
 # Input 파라미터 정의
 # ============================================================
-@dataclass
+@dataclass(slots=True)
 class BacktestInput:
     """
     백테스팅 입력 파라미터 클래스
@@ -245,11 +293,12 @@ class BacktestInput:
     slippage_rate: float = 0.001  # 슬리피지율 (0.1%)
     
     # DB 연결 설정 (.env 파일에서 불러옴)
-    db_user: str = os.getenv("DB_USER", "stockelper")
-    db_password: str = os.getenv("DB_PASSWORD", "")
-    db_host: str = os.getenv("DB_HOST", "localhost")
-    db_port: str = os.getenv("DB_PORT", "5432")
-    db_name: str = os.getenv("DB_NAME", "postgres")
+    # import 시점이 아니라 인스턴스 생성 시점의 환경변수를 읽도록 default_factory 사용
+    db_user: str = field(default_factory=lambda: os.getenv("DB_USER", "stockelper"))
+    db_password: str = field(default_factory=lambda: os.getenv("DB_PASSWORD", ""))
+    db_host: str = field(default_factory=lambda: os.getenv("DB_HOST", "localhost"))
+    db_port: str = field(default_factory=lambda: os.getenv("DB_PORT", "5432"))
+    db_name: str = field(default_factory=lambda: os.getenv("DB_NAME", "postgres"))
     
     # DART 공시 데이터 사용 여부
     use_dart_disclosure: bool = True  # True: DART 공시 사용, False: 뉴스 감성 사용 (레거시)
@@ -351,7 +400,7 @@ class BacktestInput:
 # ============================================================
 # Output 구조 정의
 # ============================================================
-@dataclass
+@dataclass(slots=True)
 class BacktestOutput:
     """
     백테스팅 출력 결과 클래스
@@ -417,6 +466,63 @@ AVAILABLE_DART_TABLES = [
 ]
 
 
+# 긍정적 이벤트 테이블
+_POSITIVE_DART_TABLES = frozenset({
+    "dart_piic_decsn",  # 유상증자
+    "dart_fric_decsn",  # 무상증자
+    "dart_pifric_decsn",  # 유무상증자
+    "dart_tsstk_aq_decsn",  # 자기주식 취득
+    "dart_tsstk_aq_trctr_cns_decsn",  # 자기주식취득 신탁계약 체결
+    "dart_bdwt_is_decsn",  # 신주인수권부사채권 발행
+    "dart_cvbd_is_decsn",  # 전환사채권 발행
+})
+
+# 부정적 이벤트 테이블
+_NEGATIVE_DART_TABLES = frozenset({
+    "dart_cr_decsn",  # 감자
+    "dart_tsstk_dp_decsn",  # 자기주식 처분
+})
+
+# 테이블명 -> disclosure 코드 (목록에 없으면 3: 중립)
+_DART_TABLE_TO_CODE: Dict[str, int] = {
+    **{t: 1 for t in _POSITIVE_DART_TABLES},
+    **{t: 2 for t in _NEGATIVE_DART_TABLES},
+}
+
+# 테이블명 -> 한글 표시명
+_DART_TABLE_DISPLAY_NAMES: Dict[str, str] = {
+    "dart_bdwt_is_decsn": "신주인수권부사채권 발행결정",
+    "dart_bsn_inh_decsn": "영업양수 결정",
+    "dart_bsn_trf_decsn": "영업양도 결정",
+    "dart_cmp_dv_decsn": "회사분할 결정",
+    "dart_cmp_dvmg_decsn": "회사분할합병 결정",
+    "dart_cmp_mg_decsn": "회사합병 결정",
+    "dart_cr_decsn": "감자 결정",
+    "dart_cvbd_is_decsn": "전환사채권 발행결정",
+    "dart_fric_decsn": "무상증자 결정",
+    "dart_otcpr_stk_invscr_inh_decsn": "타법인주식 양수결정",
+    "dart_otcpr_stk_invscr_trf_decsn": "타법인주식 양도결정",
+    "dart_pifric_decsn": "유무상증자 결정",
+    "dart_piic_decsn": "유상증자 결정",
+    "dart_stk_extr_decsn": "주식교환이전 결정",
+    "dart_tgast_inh_decsn": "유형자산 양수 결정",
+    "dart_tgast_trf_decsn": "유형자산 양도 결정",
+    "dart_tsstk_aq_decsn": "자기주식 취득 결정",
+    "dart_tsstk_aq_trctr_cc_decsn": "자기주식취득 신탁계약 해지 결정",
+    "dart_tsstk_aq_trctr_cns_decsn": "자기주식취득 신탁계약 체결 결정",
+    "dart_tsstk_dp_decsn": "자기주식 처분 결정",
+}
+
+# report_type 키워드(부분 문자열) 매칭: 키워드 목록을 하나의 alternation 정규식으로 미리 컴파일
+# 긍정적 이벤트
+_POSITIVE_REPORT_RE = re.compile("|".join(map(re.escape, [
+    "유상증자", "무상증자", "유무상증자", "자기주식 취득", "신탁계약 체결",
+    "전환사채권 발행", "신주인수권부사채권 발행",
+])))
+# 부정적 이벤트
+_NEGATIVE_REPORT_RE = re.compile("|".join(map(re.escape, ["감자", "자기주식 처분"])))
+
+
 def map_dart_table_to_disclosure_code(table_name: str) -> int:
     """
     DART 테이블명을 disclosure 코드로 변환
@@ -433,29 +539,7 @@ def map_dart_table_to_disclosure_code(table_name: str) -> int:
     Returns:
         disclosure 코드 (0, 1, 2, 3)
     """
-    # 긍정적 이벤트 테이블
-    positive_tables = [
-        "dart_piic_decsn",  # 유상증자
-        "dart_fric_decsn",  # 무상증자
-        "dart_pifric_decsn",  # 유무상증자
-        "dart_tsstk_aq_decsn",  # 자기주식 취득
-        "dart_tsstk_aq_trctr_cns_decsn",  # 자기주식취득 신탁계약 체결
-        "dart_bdwt_is_decsn",  # 신주인수권부사채권 발행
-        "dart_cvbd_is_decsn",  # 전환사채권 발행
-    ]
-    
-    # 부정적 이벤트 테이블
-    negative_tables = [
-        "dart_cr_decsn",  # 감자
-        "dart_tsstk_dp_decsn",  # 자기주식 처분
-    ]
-    
-    if table_name in positive_tables:
-        return 1
-    elif table_name in negative_tables:
-        return 2
-    else:
-        return 3  # 중립적 이벤트 (합병, 분할, 양수도 등)
+    return _DART_TABLE_TO_CODE.get(table_name, 3)  # 3: 중립적 이벤트 (합병, 분할, 양수도 등)
 
 
 def get_table_display_name(table_name: str) -> str:
@@ -468,29 +552,7 @@ def get_table_display_name(table_name: str) -> str:
     Returns:
         한글 표시명
     """
-    name_mapping = {
-        "dart_bdwt_is_decsn": "신주인수권부사채권 발행결정",
-        "dart_bsn_inh_decsn": "영업양수 결정",
-        "dart_bsn_trf_decsn": "영업양도 결정",
-        "dart_cmp_dv_decsn": "회사분할 결정",
-        "dart_cmp_dvmg_decsn": "회사분할합병 결정",
-        "dart_cmp_mg_decsn": "회사합병 결정",
-        "dart_cr_decsn": "감자 결정",
-        "dart_cvbd_is_decsn": "전환사채권 발행결정",
-        "dart_fric_decsn": "무상증자 결정",
-        "dart_otcpr_stk_invscr_inh_decsn": "타법인주식 양수결정",
-        "dart_otcpr_stk_invscr_trf_decsn": "타법인주식 양도결정",
-        "dart_pifric_decsn": "유무상증자 결정",
-        "dart_piic_decsn": "유상증자 결정",
-        "dart_stk_extr_decsn": "주식교환이전 결정",
-        "dart_tgast_inh_decsn": "유형자산 양수 결정",
-        "dart_tgast_trf_decsn": "유형자산 양도 결정",
-        "dart_tsstk_aq_decsn": "자기주식 취득 결정",
-        "dart_tsstk_aq_trctr_cc_decsn": "자기주식취득 신탁계약 해지 결정",
-        "dart_tsstk_aq_trctr_cns_decsn": "자기주식취득 신탁계약 체결 결정",
-        "dart_tsstk_dp_decsn": "자기주식 처분 결정",
-    }
-    return name_mapping.get(table_name, table_name)
+    return _DART_TABLE_DISPLAY_NAMES.get(table_name, table_name)
 
 
 def map_report_type_to_disclosure_code(report_type: str) -> int:
@@ -503,27 +565,174 @@ def map_report_type_to_disclosure_code(report_type: str) -> int:
     Returns:
         disclosure 코드 (0, 1, 2, 3)
     """
-    # 긍정적 이벤트
-    positive_keywords = ["유상증자", "무상증자", "유무상증자", "자기주식 취득", "신탁계약 체결", 
-                        "전환사채권 발행", "신주인수권부사채권 발행"]
-    # 부정적 이벤트
-    negative_keywords = ["감자", "자기주식 처분"]
-    
-    for keyword in positive_keywords:
-        if keyword in report_type:
-            return 1
-    
-    for keyword in negative_keywords:
-        if keyword in report_type:
-            return 2
-    
+    # 긍정 키워드를 먼저 확인(기존 우선순위 유지)
+    if _POSITIVE_REPORT_RE.search(report_type):
+        return 1
+    if _NEGATIVE_REPORT_RE.search(report_type):
+        return 2
     return 3  # 중립적 이벤트
 
 
+def classify_report_types(report_types: pd.Series) -> pd.Series:
+    """report_type 컬럼을 disclosure 코드 Series로 일괄 변환합니다.
+
+    공시 행은 많아도 report_type 종류는 적으므로 고유값만 분류한 뒤 매핑합니다.
+    문자열이 아닌 값(결측 등)은 중립(3)으로 처리합니다.
+    """
+    codes = {
+        rt: map_report_type_to_disclosure_code(rt) if isinstance(rt, str) else 3
+        for rt in report_types.unique()
+    }
+    return report_types.map(codes).fillna(3).astype(int)
+
+
+def normalize_event_types(report_types: pd.Series) -> pd.Series:
+    """report_type에서 ' 결정'/' 발행결정' 접미어를 떼고 소문자로 바꾼 event_type Series를 만듭니다.
+
+    classify_report_types와 같이 고유값만 변환한 뒤 매핑합니다. 문자열이 아닌 값은 그대로 둡니다.
+    """
+    names = {
+        rt: rt.replace(' 결정', '').replace(' 발행결정', '').lower()
+        for rt in report_types.unique()
+        if isinstance(rt, str)
+    }
+    return report_types.map(names)
+
+
+_DART_COLUMNS = ['event_type', 'disclosure', 'report_type', 'category']
+
+
+def _empty_dart_df() -> pd.DataFrame:
+    """공시가 없을 때 반환하는 빈 프레임(호출마다 새로 생성해 호출자 간 공유되지 않도록 함)"""
+    return pd.DataFrame(columns=_DART_COLUMNS)
+
+
+def _disclosure_rows_to_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """score_table_dart_idc 조회 결과(rcept_dt, rcept_no 순)를 날짜 인덱스 공시 프레임으로 변환합니다.
+
+    일자 축약(_collapse_daily_disclosures) 전 단계이며, 여러 종목이 섞인 결과에도 그대로 사용할 수 있습니다.
+    """
+    if 'rcept_dt' not in df.columns:
+        return _empty_dart_df()
+
+    # rcept_dt(date 타입)를 datetime으로 변환
+    df = df.assign(date=pd.to_datetime(df['rcept_dt'], errors='coerce')).dropna(subset=['date'])
+    if df.empty:
+        return _empty_dart_df()
+
+    # report_type에서 event_type 추출, category는 테이블에서 직접 가져옴
+    # (행 단위 iterrows 대신 컬럼 단위로 일괄 변환)
+    report_types = df['report_type']
+    result_df = pd.DataFrame({
+        'date': df['date'],
+        'report_type': report_types,
+        'event_type': normalize_event_types(report_types),
+        'disclosure': classify_report_types(report_types),
+        'category': df['category'],
+        'rcept_no': df['rcept_no'],
+        'stock_code': df['stock_code'],
+        'corp_name': df['corp_name'],
+    })
+    result_df = result_df.set_index('date')
+    # 같은 날짜 안에서는 rcept_no 순서를 유지(_collapse_daily_disclosures가 마지막 행을 대표로 사용)
+    return result_df.sort_index(kind='stable')
+
 
 # ============================================================
 # DB 연결 및 데이터 조회
 # ============================================================
+@lru_cache(maxsize=8)
+def _get_pg_engine(url: str) -> Engine:
+    """접속 URL별 SQLAlchemy 엔진을 프로세스 전역에서 재사용합니다.
+
+    DataLoader가 요청/도구 호출마다 생성되더라도 커넥션 풀은 공유됩니다.
+    """
+    connect_args: Dict[str, Any] = {}
+    # psycopg3는 같은 커넥션에서 prepare_threshold회 이상 실행된 쿼리를 서버 측 PREPARE로 전환합니다.
+    # 종목별로 반복되는 조회가 많으므로 낮춰서 플래너 작업을 줄일 수 있습니다(pgbouncer transaction
+    # 모드에서는 비워두세요).
+    prepare_threshold = (os.getenv("DB_PREPARE_THRESHOLD") or "").strip()
+    if prepare_threshold:
+        connect_args["prepare_threshold"] = int(prepare_threshold)
+    return create_engine(
+        url,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5") or 5),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10") or 10),
+        # 체크아웃마다 SELECT 1 왕복이 추가되므로 기본은 끄고 pool_recycle로 유휴 커넥션을 교체
+        pool_pre_ping=(os.getenv("DB_POOL_PRE_PING") or "").strip().lower() in ("1", "true", "yes", "y", "on"),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600") or 3600),
+        connect_args=connect_args,
+    )
+
+
+# 고정 SQL은 모듈 상수로 한 번만 생성(호출마다 text() 객체를 새로 만들지 않음)
+_PRICE_QUERY = text("""
+    SELECT date, open, high, low, close, volume
+    FROM daily_stock_price
+    WHERE symbol = :symbol
+    AND date >= :start_date
+    AND date <= :end_date
+    ORDER BY date
+""")
+
+# 스크리닝(모멘텀/시가총액)은 종가 꼬리 몇 개만 필요하므로 close 컬럼만 역순으로 조회
+_CLOSE_TAIL_QUERY = text("""
+    SELECT close
+    FROM daily_stock_price
+    WHERE symbol = :symbol
+    AND date >= :start_date
+    AND date <= :end_date
+    ORDER BY date DESC
+    LIMIT :n
+""")
+
+# 스크리닝용 다종목 공시 일괄 조회(_load_dart_disclosure_data와 같은 rcept_no 기준 중복 제거)
+_DISCLOSURES_BY_SYMBOLS_QUERY = text("""
+    SELECT rcept_dt, stock_code, corp_name, report_type, category, rcept_no
+    FROM (
+        SELECT DISTINCT ON (rcept_no)
+            rcept_dt,
+            stock_code,
+            corp_name,
+            report_type,
+            category,
+            rcept_no
+        FROM score_table_dart_idc
+        WHERE stock_code = ANY(:symbols)
+        AND rcept_dt >= :start_date
+        AND rcept_dt <= :end_date
+        ORDER BY rcept_no, rcept_dt, report_type, category
+    ) d
+    ORDER BY rcept_dt, rcept_no
+""")
+
+# 주가 컬럼 dtype을 명시해 결과 변환 시 타입 추론(NUMERIC -> object 등)을 건너뜀.
+# backtrader 라인이 float64이므로 float32로 줄이지 않고, NULL 거래량도 담을 수 있게 volume도 float64로 둡니다.
+_PRICE_DTYPES: Dict[str, str] = {
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "float64",
+}
+
+_ALL_SYMBOLS_QUERY = text("SELECT DISTINCT symbol FROM daily_stock_price ORDER BY symbol")
+
+_CORP_NAMES_BY_SYMBOLS_QUERY = text("""
+    SELECT DISTINCT ON (stock_code) stock_code, corp_name
+    FROM score_table_dart_idc
+    WHERE stock_code = ANY(:symbols)
+    ORDER BY stock_code, rcept_dt DESC
+""")
+
+_CORP_CODES_BY_NAMES_QUERY = text("""
+    SELECT DISTINCT ON (corp_name) corp_name, stock_code
+    FROM score_table_dart_idc
+    WHERE corp_name = ANY(:names)
+    ORDER BY corp_name, stock_code
+""")
+
+
 class DataLoader:
     """
     DB에서 주가 데이터 및 DART 공시 데이터를 조회하는 클래스
@@ -556,15 +765,77 @@ class DataLoader:
         # - SQLAlchemy 기본 스킴 `postgresql://` 은 psycopg2를 기본 드라이버로 사용하므로,
         #   운영 환경에서 psycopg2가 없을 경우 연결 실패가 날 수 있습니다.
         # - 따라서 psycopg3 드라이버를 명시합니다.
-        self.pg_engine = create_engine(
+        self.pg_engine = _get_pg_engine(
             f'postgresql+psycopg://{input_params.db_user}:{input_params.db_password}@'
             f'{input_params.db_host}:{input_params.db_port}/{input_params.db_name}'
         )
         
         # DART 공시 사용 여부
         self.use_dart = input_params.use_dart_disclosure
-    
+
+        # 조회 결과 메모이제이션(DataLoader 인스턴스 = 백테스트 1회 범위)
+        # 스크리닝 단계와 데이터 로딩 단계가 같은 (종목, 기간) 프레임을 다시 읽지 않도록 합니다.
+        # 캐시 적중 시에도 사본을 반환하므로 호출자가 프레임을 수정해도 캐시에는 영향이 없습니다.
+        self._price_cache: Dict[Tuple[str, str, str], pd.DataFrame] = {}
+        self._disclosure_cache: Dict[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]], pd.DataFrame] = {}
+        self._corp_name_cache: Dict[str, Optional[str]] = {}
+
     def get_stock_price_data(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str
+    ) -> pd.DataFrame:
+        """주가 데이터 조회(인스턴스 캐시). 실제 조회는 `_load_stock_price_data` 참고."""
+        key = (symbol, start_date, end_date)
+        df = self._price_cache.get(key)
+        if df is None:
+            df = self._load_stock_price_data(symbol, start_date, end_date)
+            self._price_cache[key] = df
+        return df.copy()
+
+    def _get_close_tail(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        n: int
+    ) -> np.ndarray:
+        """기간 내 마지막 n개 종가(날짜 오름차순). 이미 로드된 주가 데이터가 있으면 재사용합니다."""
+        if n <= 0:
+            return np.empty(0, dtype=float)
+        cached = self._price_cache.get((symbol, start_date, end_date))
+        if cached is not None:
+            if cached.empty:
+                return np.empty(0, dtype=float)
+            return cached['close'].to_numpy(dtype=float)[-n:]
+
+        with self.pg_engine.connect() as conn:
+            closes = conn.execute(
+                _CLOSE_TAIL_QUERY,
+                {"symbol": symbol, "start_date": start_date, "end_date": end_date, "n": int(n)},
+            ).scalars().all()
+        # DESC로 조회했으므로 뒤집어서 오름차순으로 맞춤
+        return np.asarray(closes[::-1], dtype=float)
+
+    def get_dart_disclosure_data(
+        self,
+        symbol: Optional[str] = None,
+        corp_name: Optional[str] = None,
+        start_date: str = None,
+        end_date: str = None
+    ) -> pd.DataFrame:
+        """공시 데이터 조회(인스턴스 캐시). 실제 조회는 `_load_dart_disclosure_data` 참고."""
+        key = (symbol, corp_name, start_date, end_date)
+        df = self._disclosure_cache.get(key)
+        if df is None:
+            df = self._load_dart_disclosure_data(
+                symbol=symbol, corp_name=corp_name, start_date=start_date, end_date=end_date
+            )
+            self._disclosure_cache[key] = df
+        return df.copy()
+
+    def _load_stock_price_data(
         self, 
         symbol: str, 
         start_date: str, 
@@ -585,21 +856,13 @@ class DataLoader:
         Raises:
             Exception: DB 연결 실패 시
         """
-        query = text("""
-            SELECT date, open, high, low, close, volume, adj_close
-            FROM daily_stock_price
-            WHERE symbol = :symbol
-            AND date >= :start_date
-            AND date <= :end_date
-            ORDER BY date
-        """)
-        
         try:
             with self.pg_engine.connect() as conn:
                 df = pd.read_sql(
-                    query,
+                    _PRICE_QUERY,
                     conn,
-                    params={"symbol": symbol, "start_date": start_date, "end_date": end_date}
+                    params={"symbol": symbol, "start_date": start_date, "end_date": end_date},
+                    dtype=_PRICE_DTYPES,
                 )
             
             if df.empty:
@@ -618,7 +881,129 @@ class DataLoader:
             print(f"❌ 오류: {symbol} 주가 데이터 조회 실패 - {e}")
             return pd.DataFrame()
     
-    def get_dart_disclosure_data(
+    def get_dart_disclosure_batch(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 종목의 공시 데이터를 한 번의 쿼리로 조회해 종목별로 나눠 반환합니다.
+
+        결과는 `get_dart_disclosure_data(symbol=..., start_date=..., end_date=...)`와 같은 키로
+        인스턴스 캐시에 채워지므로, 이후 종목별 호출(점수 계산/데이터 로딩)은 DB를 다시 조회하지 않습니다.
+        공시가 없는 종목은 빈 프레임으로 채웁니다. 조회 실패 시에는 캐시를 건드리지 않고 빈 dict를 반환합니다.
+
+        Args:
+            symbols: 종목 코드 목록
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+
+        Returns:
+            {종목코드: 공시 데이터프레임}
+        """
+        if not self.use_dart:
+            return {sym: _empty_dart_df() for sym in symbols}
+
+        pending = [
+            sym for sym in dict.fromkeys(symbols)
+            if (sym, None, start_date, end_date) not in self._disclosure_cache
+        ]
+        if pending:
+            try:
+                with self.pg_engine.connect() as conn:
+                    df = pd.read_sql(
+                        _DISCLOSURES_BY_SYMBOLS_QUERY,
+                        conn,
+                        params={
+                            "symbols": pending,
+                            "start_date": _parse_date(start_date),
+                            "end_date": _parse_date(end_date),
+                        },
+                    )
+            except Exception as e:
+                print(f"⚠️  경고: 공시 데이터 일괄 조회 실패 ({len(pending)}개 종목): {e}")
+                return {}
+
+            grouped: Dict[str, pd.DataFrame] = {}
+            if not df.empty:
+                result_df = _disclosure_rows_to_frame(df)
+                if not result_df.empty:
+                    # 동일 일자 공시가 여러 건인 경우 1일 1행으로 축약(종목별)
+                    grouped = {
+                        sym: _collapse_daily_disclosures(g)
+                        for sym, g in result_df.groupby('stock_code', sort=False)
+                    }
+            for sym in pending:
+                sym_df = grouped.get(sym)
+                self._disclosure_cache[(sym, None, start_date, end_date)] = (
+                    sym_df if sym_df is not None else _empty_dart_df()
+                )
+
+        return {sym: self._disclosure_cache[(sym, None, start_date, end_date)].copy() for sym in symbols}
+
+    def _debug_empty_disclosure(
+        self,
+        symbol: Optional[str],
+        corp_name: Optional[str],
+        where_clause: str,
+        params: Dict[str, Any],
+    ) -> None:
+        """공시 조회 결과가 없을 때 원인 파악용 진단 로그(DEBUG 전용, 추가 DB 조회 포함)"""
+        logger.debug("공시 데이터 조회 결과 없음: %s", symbol or corp_name)
+        logger.debug("WHERE 조건: %s / 파라미터: %s", where_clause, params)
+
+        # 실제로 해당 종목의 데이터가 있는지 확인 (날짜 조건 없이)
+        if symbol:
+            test_query = text("""
+                SELECT COUNT(*) as cnt, MIN(rcept_dt) as min_date, MAX(rcept_dt) as max_date
+                FROM score_table_dart_idc
+                WHERE stock_code = :symbol
+            """)
+            test_params = {"symbol": symbol}
+        else:
+            test_query = text("""
+                SELECT COUNT(*) as cnt, MIN(rcept_dt) as min_date, MAX(rcept_dt) as max_date
+                FROM score_table_dart_idc
+                WHERE corp_name = :corp_name
+            """)
+            test_params = {"corp_name": corp_name}
+
+        try:
+            with self.pg_engine.connect() as conn:
+                test_df = pd.read_sql(test_query, conn, params=test_params)
+                if test_df.empty:
+                    return
+                cnt = test_df.iloc[0]['cnt']
+                if cnt > 0:
+                    logger.debug(
+                        "테이블 내 총 데이터: %s건 (기간: %s ~ %s), 백테스팅 기간(%s ~ %s)에 데이터가 없을 수 있습니다.",
+                        cnt,
+                        test_df.iloc[0]['min_date'],
+                        test_df.iloc[0]['max_date'],
+                        params.get('start_date'),
+                        params.get('end_date'),
+                    )
+                    return
+
+                logger.debug("테이블에 해당 종목 데이터가 없습니다: %s", symbol or corp_name)
+                # stock_code 형식 확인 (앞의 0 제거한 버전도 시도)
+                if symbol:
+                    symbol_no_zero = symbol.lstrip('0') or '0'
+                    alt_query = text("""
+                        SELECT stock_code, COUNT(*) as cnt
+                        FROM score_table_dart_idc
+                        WHERE stock_code LIKE :pattern
+                        GROUP BY stock_code
+                        LIMIT 5
+                    """)
+                    alt_df = pd.read_sql(alt_query, conn, params={"pattern": f"%{symbol_no_zero}%"})
+                    if not alt_df.empty:
+                        logger.debug("유사한 stock_code: %s", alt_df['stock_code'].tolist())
+        except Exception as e:
+            logger.debug("디버깅 쿼리 실패: %s", e)
+
+    def _load_dart_disclosure_data(
         self, 
         symbol: Optional[str] = None,
         corp_name: Optional[str] = None,
@@ -639,10 +1024,10 @@ class DataLoader:
             컬럼: report_type, event_type, disclosure, category 등
         """
         if not self.use_dart:
-            return pd.DataFrame(columns=['event_type', 'disclosure', 'report_type'])
+            return _empty_dart_df()
         
         if not symbol and not corp_name:
-            return pd.DataFrame(columns=['event_type', 'disclosure', 'report_type'])
+            return _empty_dart_df()
         
         # WHERE 조건 구성
         where_conditions = []
@@ -659,26 +1044,34 @@ class DataLoader:
         if start_date:
             # YYYY-MM-DD 형식을 date 객체로 변환
             where_conditions.append("rcept_dt >= :start_date")
-            params["start_date"] = datetime.strptime(start_date, "%Y-%m-%d").date()
+            params["start_date"] = _parse_date(start_date)
         
         if end_date:
             # YYYY-MM-DD 형식을 date 객체로 변환
             where_conditions.append("rcept_dt <= :end_date")
-            params["end_date"] = datetime.strptime(end_date, "%Y-%m-%d").date()
+            params["end_date"] = _parse_date(end_date)
         
         where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
         
+        # score_table_dart_idc는 공시 1건(rcept_no)당 지표(idc_nm) 수만큼 행이 있으므로
+        # 6개 컬럼 전체 DISTINCT 대신 rcept_no 단일 키로만 중복 제거합니다.
+        # 같은 rcept_no에 report_type/category가 다른 행이 섞여 있어도 항상 같은 행이 남도록
+        # 정렬 키를 고정하고, 결과는 바깥 쿼리에서 접수일(rcept_dt) 순으로 다시 정렬합니다.
         query = text(f"""
-            SELECT DISTINCT
-                rcept_dt, 
-                stock_code, 
-                corp_name, 
-                report_type,
-                category,
-                rcept_no
-            FROM score_table_dart_idc
-            WHERE {where_clause}
-            ORDER BY rcept_dt
+            SELECT rcept_dt, stock_code, corp_name, report_type, category, rcept_no
+            FROM (
+                SELECT DISTINCT ON (rcept_no)
+                    rcept_dt,
+                    stock_code,
+                    corp_name,
+                    report_type,
+                    category,
+                    rcept_no
+                FROM score_table_dart_idc
+                WHERE {where_clause}
+                ORDER BY rcept_no, rcept_dt, report_type, category
+            ) d
+            ORDER BY rcept_dt, rcept_no
         """)
         
         try:
@@ -686,102 +1079,21 @@ class DataLoader:
                 df = pd.read_sql(query, conn, params=params)
             
             if df.empty:
-                # 디버깅: 쿼리와 파라미터 출력
-                print(f"   🔍 디버깅: {symbol or corp_name} 공시 데이터 조회 결과 없음")
-                print(f"      WHERE 조건: {where_clause}")
-                print(f"      파라미터: {params}")
-                print(f"      쿼리: SELECT DISTINCT rcept_dt, stock_code, corp_name, report_type, category, rcept_no FROM score_table_dart_idc WHERE {where_clause}")
-                # 실제로 해당 종목의 데이터가 있는지 확인 (날짜 조건 없이)
-                test_query = text("""
-                    SELECT COUNT(*) as cnt, MIN(rcept_dt) as min_date, MAX(rcept_dt) as max_date
-                    FROM score_table_dart_idc
-                    WHERE stock_code = :symbol
-                """)
-                test_params = {"symbol": symbol} if symbol else {}
-                if not symbol and corp_name:
-                    test_query = text("""
-                        SELECT COUNT(*) as cnt, MIN(rcept_dt) as min_date, MAX(rcept_dt) as max_date
-                        FROM score_table_dart_idc
-                        WHERE corp_name = :corp_name
-                    """)
-                    test_params = {"corp_name": corp_name}
-                
-                try:
-                    with self.pg_engine.connect() as conn:
-                        test_df = pd.read_sql(test_query, conn, params=test_params)
-                        if not test_df.empty:
-                            cnt = test_df.iloc[0]['cnt']
-                            min_date = test_df.iloc[0]['min_date']
-                            max_date = test_df.iloc[0]['max_date']
-                            if cnt > 0:
-                                print(f"      ⚠️  테이블 내 총 데이터: {cnt}건 (기간: {min_date} ~ {max_date})")
-                                print(f"      💡 백테스팅 기간({params.get('start_date')} ~ {params.get('end_date')})에 데이터가 없을 수 있습니다.")
-                            else:
-                                print(f"      ⚠️  테이블에 해당 종목 데이터가 없습니다.")
-                                # stock_code 형식 확인 (앞의 0 제거한 버전도 시도)
-                                if symbol:
-                                    symbol_no_zero = symbol.lstrip('0') or '0'
-                                    alt_query = text("""
-                                        SELECT DISTINCT stock_code, COUNT(*) as cnt
-                                        FROM score_table_dart_idc
-                                        WHERE stock_code LIKE :pattern
-                                        GROUP BY stock_code
-                                        LIMIT 5
-                                    """)
-                                    try:
-                                        with self.pg_engine.connect() as conn:
-                                            alt_df = pd.read_sql(alt_query, conn, params={"pattern": f"%{symbol_no_zero}%"})
-                                            if not alt_df.empty:
-                                                print(f"      💡 유사한 stock_code: {alt_df['stock_code'].tolist()}")
-                                    except:
-                                        pass
-                except Exception as e:
-                    print(f"      ⚠️  디버깅 쿼리 실패: {e}")
-                return pd.DataFrame(columns=['event_type', 'disclosure', 'report_type', 'category'])
-            
-            # 날짜를 인덱스로 설정
-            # rcept_dt가 이미 date 타입이므로 직접 사용
-            if 'rcept_dt' in df.columns:
-                # date 타입을 datetime으로 변환
-                df['date'] = pd.to_datetime(df['rcept_dt'], errors='coerce')
-                df = df.dropna(subset=['date'])
-            else:
-                return pd.DataFrame(columns=['event_type', 'disclosure', 'report_type', 'category'])
-            
-            # report_type에서 event_type 추출, category는 테이블에서 직접 가져옴
-            all_data = []
-            for _, row in df.iterrows():
-                report_type = row.get('report_type', '')
-                # report_type을 기반으로 event_type 추출
-                event_type = report_type.replace(' 결정', '').replace(' 발행결정', '').lower()
-                category = row.get('category', '기타')  # 테이블에서 직접 가져옴
-                disclosure = map_report_type_to_disclosure_code(report_type)
-                
-                all_data.append({
-                    'date': row['date'],
-                    'report_type': report_type,
-                    'event_type': event_type,
-                    'disclosure': disclosure,
-                    'category': category,
-                    'rcept_no': row.get('rcept_no', ''),
-                    'stock_code': row.get('stock_code', ''),
-                    'corp_name': row.get('corp_name', ''),
-                })
-            
-            if not all_data:
-                return pd.DataFrame(columns=['event_type', 'disclosure', 'report_type', 'category'])
+                # 유니버스 스크리닝 중에는 공시가 없는 종목이 흔하므로, 진단 출력/추가 조회는 DEBUG 레벨에서만 수행
+                if logger.isEnabledFor(logging.DEBUG):
+                    self._debug_empty_disclosure(symbol, corp_name, where_clause, params)
+                return _empty_dart_df()
             
-            result_df = pd.DataFrame(all_data)
-            result_df = result_df.set_index('date')
-            result_df = result_df.sort_index()
+            result_df = _disclosure_rows_to_frame(df)
+            if result_df.empty:
+                return _empty_dart_df()
 
             # 동일 일자 공시가 여러 건인 경우 1일 1행으로 축약(인덱스 중복 방지 + 신호 우선순위 반영)
-            result_df = _collapse_daily_disclosures(result_df)
-            return result_df
+            return _collapse_daily_disclosures(result_df)
                     
         except Exception as e:
             print(f"⚠️  경고: 공시 데이터 조회 실패 ({symbol or corp_name}): {e}")
-            return pd.DataFrame(columns=['event_type', 'disclosure', 'report_type', 'category'])
+            return _empty_dart_df()
     
     async def get_news_sentiment_data(
         self, 
@@ -833,32 +1145,28 @@ class DataLoader:
         2) 데이터가 없으면 0.0(중립) 반환
         """
         try:
-            start_dt = _to_datetime(start_date)
-            end_dt = _to_datetime(end_date)
-            if end_dt < start_dt:
-                start_dt, end_dt = end_dt, start_dt
-            if lookback_days and lookback_days > 0:
-                window_start = max(start_dt, end_dt - timedelta(days=int(lookback_days)))
-            else:
-                window_start = start_dt
-            window_start_str = window_start.strftime("%Y-%m-%d")
+            window_start_str = _screening_window_start(start_date, end_date, lookback_days)
 
             if self.use_dart:
                 # DART 공시 기반 점수 계산
-                df_dart = self.get_dart_disclosure_data(symbol=symbol, start_date=window_start_str, end_date=end_date)
+                # 동기 DB 조회를 스레드로 넘겨 스크리닝 gather가 실제로 겹쳐 실행되도록 함
+                df_dart = await asyncio.to_thread(
+                    self.get_dart_disclosure_data,
+                    symbol=symbol,
+                    start_date=window_start_str,
+                    end_date=end_date,
+                )
                 if not df_dart.empty and "disclosure" in df_dart.columns:
-                    # disclosure 코드를 기반으로 점수 계산
-                    # 1(긍정) -> +1, 2(부정) -> -1, 3(중립) -> 0
-                    disclosure_scores = df_dart["disclosure"].map({
-                        1: 1.0 * self.input.dart_event_score_weight,
-                        2: -1.0 * self.input.dart_event_score_weight,
-                        3: 0.0
-                    }).fillna(0.0)
+                    # disclosure 코드를 기반으로 점수 계산(numpy 배열에서 바로 계산)
+                    # 1(긍정) -> +1, 2(부정) -> -1, 3(중립)/기타 -> 0
+                    codes = df_dart["disclosure"].to_numpy()
+                    w = float(self.input.dart_event_score_weight)
+                    disclosure_scores = np.where(codes == 1, w, np.where(codes == 2, -w, 0.0))
                     
                     # 최근 이벤트에 더 높은 가중치 부여 (선형 감쇠)
-                    if len(disclosure_scores) > 0:
-                        weights = np.linspace(0.5, 1.0, len(disclosure_scores))
-                        weighted_score = (disclosure_scores * weights).sum() / weights.sum()
+                    if disclosure_scores.size > 0:
+                        weights = np.linspace(0.5, 1.0, disclosure_scores.size)
+                        weighted_score = (disclosure_scores @ weights) / weights.sum()
                         return float(np.clip(weighted_score, -1.0, 1.0))
                     else:
                         return 0.0
@@ -934,64 +1242,64 @@ class DataLoader:
             종목 코드 리스트
         """
         # 특정 종목이 지정되어 있으면 해당 종목만 반환
+        # (중복 종목은 데이터 로드/스크리닝을 중복 수행하므로 순서를 유지한 채 제거)
         if self.input.target_symbols:
-            return self.input.target_symbols
+            return list(dict.fromkeys(self.input.target_symbols))
         
         if self.input.target_corp_names:
             # 종목명으로 종목코드 조회 (score_table_dart_idc에서 조회)
+            # 회사명마다 왕복하지 않도록 ANY(:names) 한 번으로 조회
+            corp_names = list(dict.fromkeys(self.input.target_corp_names))
+            code_by_name: Dict[str, str] = {}
+            try:
+                with self.pg_engine.connect() as conn:
+                    for name, code in conn.execute(_CORP_CODES_BY_NAMES_QUERY, {"names": corp_names}):
+                        if code:
+                            code_by_name[name] = code
+            except Exception as e:
+                print(f"⚠️  경고: 종목코드 조회 실패 ({', '.join(corp_names)}) - {e}")
+
             symbols = []
-            for corp_name in self.input.target_corp_names:
-                try:
-                    query = text("""
-                        SELECT DISTINCT stock_code 
-                        FROM score_table_dart_idc 
-                        WHERE corp_name = :corp_name
-                        LIMIT 1
-                    """)
-                    with self.pg_engine.connect() as conn:
-                        result = conn.execute(query, {"corp_name": corp_name})
-                        row = result.fetchone()
-                        if row and row[0]:
-                            symbols.append(row[0])
-                        else:
-                            print(f"⚠️  경고: {corp_name}의 종목코드를 찾을 수 없습니다.")
-                except Exception as e:
-                    print(f"⚠️  경고: {corp_name} 종목코드 조회 실패 - {e}")
+            for corp_name in corp_names:
+                code = code_by_name.get(corp_name)
+                if code:
+                    symbols.append(code)
+                else:
+                    print(f"⚠️  경고: {corp_name}의 종목코드를 찾을 수 없습니다.")
             
-            return symbols if symbols else self._get_all_symbols()
+            return list(dict.fromkeys(symbols)) if symbols else self._get_all_symbols()
         
         return self._get_all_symbols()
     
     def _get_all_symbols(self) -> List[str]:
         """DB에 있는 모든 종목 코드 반환"""
-        query = text("SELECT DISTINCT symbol FROM daily_stock_price ORDER BY symbol")
-        
         try:
             with self.pg_engine.connect() as conn:
-                symbols = [row[0] for row in conn.execute(query)]
+                symbols = [row[0] for row in conn.execute(_ALL_SYMBOLS_QUERY)]
             return symbols
         except Exception as e:
             print(f"❌ 오류: 유니버스 종목 조회 실패 - {e}")
             return []
     
-    def get_corp_name_from_symbol(self, symbol: str) -> Optional[str]:
-        """종목코드로 회사명 조회"""
-        # score_table_dart_idc에서 회사명 조회
+    def prefetch_corp_names(self, symbols: List[str]) -> None:
+        """여러 종목의 회사명을 한 번의 쿼리로 조회해 캐시합니다(종목별 왕복 방지)."""
+        pending = [sym for sym in dict.fromkeys(symbols) if sym not in self._corp_name_cache]
+        if not pending:
+            return
+        # score_table_dart_idc에서 종목별 최신 공시 기준 회사명 조회
         try:
-            query = text("""
-                SELECT DISTINCT corp_name 
-                FROM score_table_dart_idc 
-                WHERE stock_code = :symbol 
-                LIMIT 1
-            """)
             with self.pg_engine.connect() as conn:
-                result = conn.execute(query, {"symbol": symbol})
-                row = result.fetchone()
-                if row:
-                    return row[0]
-        except:
-            pass
-        return None
+                found = dict(conn.execute(_CORP_NAMES_BY_SYMBOLS_QUERY, {"symbols": pending}).all())
+        except Exception:
+            return
+        for symbol in pending:
+            self._corp_name_cache[symbol] = found.get(symbol)
+
+    def get_corp_name_from_symbol(self, symbol: str) -> Optional[str]:
+        """종목코드로 회사명 조회"""
+        if symbol not in self._corp_name_cache:
+            self.prefetch_corp_names([symbol])
+        return self._corp_name_cache.get(symbol)
     
     def get_stock_momentum_score(
         self,
@@ -1013,20 +1321,16 @@ class DataLoader:
             모멘텀 점수 (수익률 %)
         """
         try:
-            df_price = self.get_stock_price_data(symbol, start_date, end_date)
-            if df_price.empty or len(df_price) < 2:
-                return 0.0
-            
-            # 최근 lookback_days일의 수익률 계산
-            recent_prices = df_price['close'].tail(lookback_days)
+            # 최근 lookback_days일의 수익률 계산 (종가 꼬리만 조회)
+            recent_prices = self._get_close_tail(symbol, start_date, end_date, lookback_days)
             if len(recent_prices) < 2:
                 return 0.0
             
-            start_price = recent_prices.iloc[0]
-            end_price = recent_prices.iloc[-1]
+            start_price = recent_prices[0]
+            end_price = recent_prices[-1]
             
             if start_price > 0:
-                return ((end_price - start_price) / start_price) * 100.0
+                return float((end_price - start_price) / start_price * 100.0)
         except:
             pass
         
@@ -1050,19 +1354,18 @@ class DataLoader:
             시가총액 점수 (원)
         """
         try:
-            df_price = self.get_stock_price_data(symbol, start_date, end_date)
-            if df_price.empty:
-                return 0.0
-            
             # 최근 종가
-            recent_close = df_price['close'].iloc[-1]
+            closes = self._get_close_tail(symbol, start_date, end_date, 1)
+            if len(closes) == 0:
+                return 0.0
+            recent_close = closes[-1]
             
             # 발행주식수는 DB에서 조회하거나 추정값 사용
             # 여기서는 간단히 종가 * 1000만주로 추정 (실제로는 DB에서 조회 필요)
             estimated_shares = 10000000  # 1000만주 추정
             market_cap = recent_close * estimated_shares
             
-            return market_cap
+            return float(market_cap)
         except:
             pass
         
@@ -1138,12 +1441,12 @@ class DataLoader:
         if start_date:
             # YYYY-MM-DD 형식을 date 객체로 변환
             where_conditions.append("rcept_dt >= :start_date")
-            params["start_date"] = datetime.strptime(start_date, "%Y-%m-%d").date()
+            params["start_date"] = _parse_date(start_date)
         
         if end_date:
             # YYYY-MM-DD 형식을 date 객체로 변환
             where_conditions.append("rcept_dt <= :end_date")
-            params["end_date"] = datetime.strptime(end_date, "%Y-%m-%d").date()
+            params["end_date"] = _parse_date(end_date)
         
         if report_types:
             where_conditions.append("report_type = ANY(:report_types)")
@@ -1193,8 +1496,137 @@ class DataLoader:
 # ============================================================
 # 지표 조건 확인 함수
 # ============================================================
+def _eq_with_tolerance(score: float, min_val: Optional[float], max_val: Optional[float]) -> bool:
+    # idc_score == min_val (또는 max_val), 부동소수점 오차 고려
+    target_val = min_val if min_val is not None else max_val
+    return target_val is not None and abs(score - target_val) < 1e-6
+
+
+# 지표 조건 operator -> 판정 함수 (score, min, max) -> bool
+# 필요한 경계값(min/max)이 없으면 조건 불충족으로 처리합니다.
+_INDICATOR_CONDITION_OPS: Dict[str, Callable[[float, Optional[float], Optional[float]], bool]] = {
+    # min_val <= idc_score <= max_val (없는 경계는 무시)
+    "between": lambda score, lo, hi: (lo is None or score >= lo) and (hi is None or score <= hi),
+    ">=": lambda score, lo, hi: lo is not None and score >= lo,
+    "<=": lambda score, lo, hi: hi is not None and score <= hi,
+    ">": lambda score, lo, hi: lo is not None and score > lo,
+    "<": lambda score, lo, hi: hi is not None and score < hi,
+    "==": _eq_with_tolerance,
+}
+
+
+@dataclass(slots=True)
+class IndicatorTable:
+    """지표 데이터프레임을 컬럼별 numpy 배열로 펼친 조회 전용 테이블.
+
+    check_indicator_conditions는 bar마다 호출되므로, 전략 생성 시 한 번만 변환해 두고
+    매 호출에서는 배열 슬라이스/비교만 수행합니다.
+    """
+
+    date: np.ndarray
+    report_type: np.ndarray
+    idc_nm: np.ndarray
+    idc_score: np.ndarray
+    # 날짜 오름차순 정렬 여부(정렬돼 있으면 searchsorted로 현재 날짜까지 자름)
+    is_sorted: bool = True
+
+    @classmethod
+    def from_frame(cls, indicator_df: pd.DataFrame) -> "IndicatorTable":
+        return cls(
+            date=np.asarray(pd.DatetimeIndex(indicator_df.index).values),
+            report_type=np.asarray(indicator_df['report_type'].values),
+            idc_nm=np.asarray(indicator_df['idc_nm'].values),
+            idc_score=np.asarray(indicator_df['idc_score'].values),
+            is_sorted=bool(indicator_df.index.is_monotonic_increasing),
+        )
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+
+@dataclass(slots=True)
+class IndicatorConditionMatcher:
+    """IndicatorTable에 지표 조건 목록을 미리 적용해 둔 매칭 결과.
+
+    조건별로 (report_type, idc_nm)이 일치하는 행 위치와, 그 행의 idc_score가 조건(operator/min/max)을
+    만족하는지를 한 번만 계산합니다. 매 bar에서는 현재 날짜까지 보이는 마지막 매칭 행을
+    searchsorted로 찾아 미리 계산한 결과만 확인합니다.
+    """
+
+    table: IndicatorTable
+    conditions: List[Dict[str, Any]]
+    # 조건별 매칭 행 위치(테이블 순서)와 각 행의 조건 충족 여부
+    rows: List[np.ndarray]
+    met: List[np.ndarray]
+
+    @classmethod
+    def build(
+        cls,
+        table: IndicatorTable,
+        event_indicator_conditions: List[Dict[str, Any]],
+    ) -> "IndicatorConditionMatcher":
+        rows: List[np.ndarray] = []
+        met: List[np.ndarray] = []
+        for condition in event_indicator_conditions:
+            cond = condition.get("condition") or {}
+            min_val = cond.get("min")
+            max_val = cond.get("max")
+            check = _INDICATOR_CONDITION_OPS.get(cond.get("operator", "between"))  # 기본값: between
+
+            # 해당 report_type과 idc_nm의 지표 행
+            pos = np.flatnonzero(
+                (table.report_type == condition.get("report_type"))
+                & (table.idc_nm == condition.get("idc_nm"))
+            )
+            ok = np.zeros(len(pos), dtype=bool)
+            if check is not None:
+                for j, idc_score in enumerate(table.idc_score[pos]):
+                    if idc_score is None or pd.isna(idc_score):
+                        continue
+                    try:
+                        ok[j] = bool(check(idc_score, min_val, max_val))
+                    except TypeError:
+                        # 비교할 수 없는 점수는 조건 불충족으로 처리
+                        pass
+            rows.append(pos)
+            met.append(ok)
+        return cls(table=table, conditions=list(event_indicator_conditions), rows=rows, met=met)
+
+    def signal_at(self, current_date: datetime) -> Dict[str, Any]:
+        """check_indicator_conditions와 같은 형식의 신호를 반환합니다."""
+        table = self.table
+        current = np.datetime64(current_date)
+        cut = int(np.searchsorted(table.date, current, side="right")) if table.is_sorted else 0
+
+        for condition, pos, ok in zip(self.conditions, self.rows, self.met):
+            # 현재 날짜 이전의 가장 최근 매칭 지표
+            if table.is_sorted:
+                j = int(np.searchsorted(pos, cut, side="left")) - 1
+            else:
+                visible = np.flatnonzero(table.date[pos] <= current)
+                j = int(visible[-1]) if visible.size else -1
+            if j < 0 or not ok[j]:
+                continue
+
+            # delay_days 고려
+            latest_pos = pos[j]
+            indicator_date = pd.Timestamp(table.date[latest_pos])
+            signal_date = indicator_date + timedelta(days=condition.get("delay_days", 0))
+            if signal_date <= current_date:
+                return {
+                    "action": condition.get("action", "NEUTRAL"),
+                    "report_type": condition.get("report_type"),
+                    "idc_nm": condition.get("idc_nm"),
+                    "idc_score": float(table.idc_score[latest_pos]),
+                    "signal_date": signal_date,
+                    "indicator_date": indicator_date
+                }
+
+        return {"action": "NEUTRAL", "report_type": "", "idc_nm": "", "idc_score": None}
+
+
 def check_indicator_conditions(
-    indicator_df: pd.DataFrame,
+    indicator_df: Union[pd.DataFrame, IndicatorTable],
     event_indicator_conditions: List[Dict[str, Any]],
     current_date: datetime
 ) -> Dict[str, Any]:
@@ -1202,101 +1634,232 @@ def check_indicator_conditions(
     이벤트별 지표 조건을 확인하여 매매 신호 생성
     
     Args:
-        indicator_df: 지표 데이터프레임 (report_type, idc_nm, idc_score 컬럼 포함)
+        indicator_df: 지표 데이터프레임 (report_type, idc_nm, idc_score 컬럼 포함) 또는 IndicatorTable
         event_indicator_conditions: 이벤트별 지표 조건 설정
         current_date: 현재 날짜
     
     Returns:
         {"action": "BUY"/"SELL"/"NEUTRAL", "report_type": ..., "idc_nm": ..., "idc_score": ...}
     """
-    if indicator_df.empty or not event_indicator_conditions:
-        return {"action": "NEUTRAL", "report_type": "", "idc_nm": "", "idc_score": None}
-    
-    # 현재 날짜 이전의 지표 데이터만 확인
-    recent_indicators = indicator_df[indicator_df.index <= current_date]
-    
-    if recent_indicators.empty:
+    if len(indicator_df) == 0 or not event_indicator_conditions:
         return {"action": "NEUTRAL", "report_type": "", "idc_nm": "", "idc_score": None}
-    
-    # 각 조건 확인
-    for condition in event_indicator_conditions:
-        report_type = condition.get("report_type")
-        idc_nm = condition.get("idc_nm")
-        action = condition.get("action", "NEUTRAL")
-        delay_days = condition.get("delay_days", 0)
-        cond = condition.get("condition", {})
-        
-        # 해당 report_type과 idc_nm의 지표 확인
-        matching_indicators = recent_indicators[
-            (recent_indicators['report_type'] == report_type) &
-            (recent_indicators['idc_nm'] == idc_nm)
-        ]
-        
-        if not matching_indicators.empty:
-            # 가장 최근 지표 확인
-            latest_indicator = matching_indicators.iloc[-1]
-            idc_score = latest_indicator.get('idc_score')
-            
-            if idc_score is None or pd.isna(idc_score):
-                continue
-            
-            # 지표 조건 확인
-            min_val = cond.get("min")
-            max_val = cond.get("max")
-            operator = cond.get("operator", "between")  # 기본값: between
-            
-            condition_met = False
-            
-            if operator == "between":
-                # min_val <= idc_score <= max_val
-                condition_met = True
-                if min_val is not None and idc_score < min_val:
-                    condition_met = False
-                if max_val is not None and idc_score > max_val:
-                    condition_met = False
-            elif operator == ">=":
-                # idc_score >= min_val
-                if min_val is not None:
-                    condition_met = idc_score >= min_val
-            elif operator == "<=":
-                # idc_score <= max_val
-                if max_val is not None:
-                    condition_met = idc_score <= max_val
-            elif operator == ">":
-                # idc_score > min_val
-                if min_val is not None:
-                    condition_met = idc_score > min_val
-            elif operator == "<":
-                # idc_score < max_val
-                if max_val is not None:
-                    condition_met = idc_score < max_val
-            elif operator == "==":
-                # idc_score == min_val (또는 max_val)
-                target_val = min_val if min_val is not None else max_val
-                if target_val is not None:
-                    condition_met = abs(idc_score - target_val) < 1e-6  # 부동소수점 오차 고려
-            
-            if condition_met:
-                # delay_days 고려
-                indicator_date = matching_indicators.index[-1]
-                signal_date = indicator_date + timedelta(days=delay_days)
-                
-                if signal_date <= current_date:
+
+    table = indicator_df if isinstance(indicator_df, IndicatorTable) else IndicatorTable.from_frame(indicator_df)
+    return IndicatorConditionMatcher.build(table, event_indicator_conditions).signal_at(current_date)
+
+
+# ============================================================
+# 카테고리별 매매 신호 생성 함수
+# ============================================================
+def _compile_event_pattern(event_signals: Dict[str, Dict[str, Any]]) -> "re.Pattern[str]":
+    """세부 이벤트명 전체를 하나의 정규식 alternation으로 컴파일(어떤 이벤트라도 포함되는지 한 번에 확인)"""
+    return re.compile("|".join(re.escape(name) for name in event_signals))
+
+
+def _match_event_signals(
+    event_type: Any,
+    report_type: Any,
+    event_signals: Dict[str, Dict[str, Any]],
+    pattern: Optional["re.Pattern[str]"] = None,
+) -> Tuple[Tuple[str, Any, Any], ...]:
+    """event_type/report_type에 포함된 세부 이벤트 설정을 (이벤트명, action, delay_days) 목록으로 반환(설정 순서 유지).
+
+    어느 매칭이 유효한지는 delay_days와 현재 날짜에 따라 달라지므로 첫 매칭만이 아니라 전체를 보관합니다.
+    pattern(_compile_event_pattern)을 주면 어떤 이벤트명도 포함하지 않는 문자열은 설정 순회 없이 바로 걸러냅니다.
+    """
+    if not isinstance(event_type, str) or not isinstance(report_type, str):
+        return ()
+    if pattern is not None and pattern.search(event_type) is None and pattern.search(report_type) is None:
+        return ()
+    return tuple(
+        (name, cfg.get("action", "NEUTRAL"), cfg.get("delay_days", 0))
+        for name, cfg in event_signals.items()
+        if name in event_type or name in report_type
+    )
+
+
+@dataclass(slots=True)
+class DisclosureTimeline:
+    """disclosure 코드 기반 매매 판단용으로 공시 데이터프레임의 날짜/코드/이벤트명을 배열로 펼친 테이블.
+
+    bar마다 `sentiment_df.loc[:날짜문자열]`로 슬라이스하는 대신 정수(ns) 날짜 배열에서
+    searchsorted로 해당 일자까지의 마지막 공시 위치를 찾습니다.
+    """
+
+    date_ns: np.ndarray
+    disclosure: np.ndarray
+    event_type: np.ndarray
+
+    @classmethod
+    def from_frame(cls, disclosure_df: pd.DataFrame) -> "DisclosureTimeline":
+        n = len(disclosure_df)
+        if 'disclosure' in disclosure_df.columns:
+            disclosure = pd.to_numeric(disclosure_df['disclosure'], errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+        else:
+            disclosure = np.zeros(n, dtype=np.int64)
+        if 'event_type' in disclosure_df.columns:
+            event_type = disclosure_df['event_type'].to_numpy(dtype=object)
+        else:
+            event_type = np.full(n, 'general', dtype=object)
+        return cls(
+            date_ns=pd.DatetimeIndex(disclosure_df.index).as_unit('ns').asi8,
+            disclosure=disclosure,
+            event_type=event_type,
+        )
+
+    def latest_pos(self, day: date) -> int:
+        """해당 일자(하루 전체 포함)까지의 마지막 공시 위치(-1이면 없음)"""
+        day_end = pd.Timestamp(day + timedelta(days=1)).value
+        return int(np.searchsorted(self.date_ns, day_end, side="left")) - 1
+
+
+@dataclass(slots=True)
+class CategorySignalTable:
+    """공시 데이터프레임의 행별 이벤트/카테고리 신호 설정을 미리 풀어둔 조회 테이블.
+
+    신호 설정(category_signals/event_signals)은 백테스트 동안 고정이므로, 공시 행마다
+    "어떤 세부 이벤트에 매칭되는지", "카테고리 신호가 있는지"를 한 번만 계산해 두고
+    매 bar에서는 현재 날짜의 최신 공시 위치만 찾아 결과를 조립합니다.
+    """
+
+    date: np.ndarray
+    event_type: np.ndarray
+    category: np.ndarray
+    # 행별 세부 이벤트 매칭 목록((이벤트명, action, delay_days), ... / 설정 순서 유지)
+    event_matches: List[Tuple[Tuple[str, Any, Any], ...]]
+    # 카테고리 신호 설정(category_signals에 없는 카테고리는 None)
+    category_action: np.ndarray
+    category_delay: np.ndarray
+    is_sorted: bool = True
+
+    @classmethod
+    def from_frame(
+        cls,
+        disclosure_df: pd.DataFrame,
+        category_signals: Dict[str, Dict[str, Any]],
+        event_signals: Dict[str, Dict[str, Any]],
+    ) -> "CategorySignalTable":
+        n = len(disclosure_df)
+        empty_col = np.full(n, '', dtype=object)
+        event_types = disclosure_df['event_type'].to_numpy(dtype=object) if 'event_type' in disclosure_df.columns else empty_col
+        report_types = disclosure_df['report_type'].to_numpy(dtype=object) if 'report_type' in disclosure_df.columns else empty_col
+        has_category = 'category' in disclosure_df.columns
+        categories = disclosure_df['category'].to_numpy(dtype=object) if has_category else empty_col
+
+        # 세부 이벤트 매칭: 공시 행은 많아도 (event_type, report_type) 조합은 적으므로 조합별로 한 번만 계산
+        event_matches: List[Tuple[Tuple[str, Any, Any], ...]] = [()] * n
+        if event_signals:
+            matches_by_pair: Dict[Tuple[Any, Any], Tuple[Tuple[str, Any, Any], ...]] = {}
+            pattern = _compile_event_pattern(event_signals)
+            for i, pair in enumerate(zip(event_types, report_types)):
+                matches = matches_by_pair.get(pair)
+                if matches is None:
+                    matches = matches_by_pair[pair] = _match_event_signals(pair[0], pair[1], event_signals, pattern)
+                event_matches[i] = matches
+
+        # 카테고리 신호 설정은 컬럼 단위 dict 매핑으로 일괄 조회
+        category_action = np.full(n, None, dtype=object)
+        category_delay = np.zeros(n, dtype=object)
+        if has_category and category_signals:
+            category_col = disclosure_df['category']
+            configured = category_col.isin(list(category_signals)).to_numpy()
+            if configured.any():
+                configured_col = category_col[configured]
+                category_action[configured] = configured_col.map(
+                    {k: cfg.get("action", "NEUTRAL") for k, cfg in category_signals.items()}
+                ).to_numpy(dtype=object)
+                category_delay[configured] = configured_col.map(
+                    {k: cfg.get("delay_days", 0) for k, cfg in category_signals.items()}
+                ).to_numpy(dtype=object)
+
+        return cls(
+            date=np.asarray(pd.DatetimeIndex(disclosure_df.index).values),
+            event_type=event_types,
+            category=categories,
+            event_matches=event_matches,
+            category_action=category_action,
+            category_delay=category_delay,
+            is_sorted=bool(disclosure_df.index.is_monotonic_increasing),
+        )
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def _latest_pos(self, current_date: datetime) -> int:
+        """current_date 이전(포함) 가장 최근 공시의 위치(-1이면 없음)"""
+        current = np.datetime64(current_date)
+        if self.is_sorted:
+            return int(np.searchsorted(self.date, current, side="right")) - 1
+        hits = np.flatnonzero(self.date <= current)
+        return int(hits[-1]) if hits.size else -1
+
+    def signal_at(self, current_date: datetime) -> Dict[str, Any]:
+        """generate_category_signals와 같은 형식의 신호를 반환합니다."""
+        pos = self._latest_pos(current_date)
+        if pos < 0:
+            return {"action": "NEUTRAL", "categories": [], "signal_date": current_date, "event_type": ""}
+
+        latest_date = pd.Timestamp(self.date[pos])
+        category = self.category[pos]
+        event_type = self.event_type[pos]
+
+        # 1단계: 세부 이벤트별 신호 확인 (우선순위 높음)
+        # 신호 일자가 도래한 첫 매칭 이벤트만 사용(BUY/SELL이 아니면 카테고리 신호로 넘어감)
+        for event_name, action, delay_days in self.event_matches[pos]:
+            signal_date = latest_date + timedelta(days=delay_days)
+            if signal_date <= current_date:
+                if action in ("BUY", "SELL"):
+                    detail = {
+                        "category": category,
+                        "event_type": event_name,
+                        "disclosure_date": latest_date,
+                        "signal_date": signal_date,
+                    }
                     return {
                         "action": action,
-                        "report_type": report_type,
-                        "idc_nm": idc_nm,
-                        "idc_score": float(idc_score),
+                        "categories": [category],
                         "signal_date": signal_date,
-                        "indicator_date": indicator_date
+                        "event_type": event_name,
+                        "details": [detail],
                     }
-    
-    return {"action": "NEUTRAL", "report_type": "", "idc_nm": "", "idc_score": None}
+                break
+
+        # 2단계: 세부 이벤트 신호가 없으면 카테고리별 신호 확인
+        action = self.category_action[pos]
+        if action is not None:
+            signal_date = latest_date + timedelta(days=self.category_delay[pos])
+            if signal_date <= current_date:
+                detail = {
+                    "category": category,
+                    "event_type": event_type,
+                    "disclosure_date": latest_date,
+                    "signal_date": signal_date,
+                }
+                if action in ("BUY", "SELL"):
+                    return {
+                        "action": action,
+                        "categories": [category],
+                        "signal_date": signal_date,
+                        "event_type": event_type,
+                        "details": [detail],
+                    }
+                return {
+                    "action": "NEUTRAL",
+                    "categories": [category],
+                    "signal_date": current_date,
+                    "event_type": event_type,
+                    "details": [detail],
+                }
+
+        return {
+            "action": "NEUTRAL",
+            "categories": [],
+            "signal_date": current_date,
+            "event_type": event_type,
+            "details": [],
+        }
 
 
-# ============================================================
-# 카테고리별 매매 신호 생성 함수
-# ============================================================
 def generate_category_signals(
     disclosure_df: pd.DataFrame,
     category_signals: Dict[str, Dict[str, Any]],
@@ -1306,6 +1869,12 @@ def generate_category_signals(
     """
     카테고리별 공시 정보를 기반으로 매매 신호 생성 (REPORT_CATEGORIES 기반)
     
+    - 현재 날짜 이전의 가장 최근 공시 1건을 기준으로 판단
+    - 세부 이벤트 신호(event_signals)가 카테고리 신호(category_signals)보다 우선
+    - 신호 일자(공시일 + delay_days)가 현재 날짜 이전이어야 유효
+    
+    bar마다 반복 호출하는 경우 CategorySignalTable을 한 번 만들어 `signal_at`을 사용하세요.
+    
     Args:
         disclosure_df: 공시 데이터프레임 (category, event_type 컬럼 포함)
         category_signals: 카테고리별 신호 설정
@@ -1318,106 +1887,7 @@ def generate_category_signals(
     if disclosure_df.empty:
         return {"action": "NEUTRAL", "categories": [], "signal_date": current_date, "event_type": ""}
     
-    # 현재 날짜 기준으로 공시 발생 여부 확인
-    buy_signals = []
-    sell_signals = []
-    neutral_signals = []
-    
-    # 최근 공시 확인 (현재 날짜 이전의 공시만)
-    recent_disclosures = disclosure_df[disclosure_df.index <= current_date]
-    
-    if recent_disclosures.empty:
-        return {"action": "NEUTRAL", "categories": [], "signal_date": current_date, "event_type": ""}
-    
-    # 가장 최근 공시 확인
-    latest_disclosure = recent_disclosures.iloc[-1]
-    latest_date = recent_disclosures.index[-1]
-    
-    # 1단계: 세부 이벤트별 신호 확인 (우선순위 높음)
-    event_type = latest_disclosure.get('event_type', '')
-    report_type = latest_disclosure.get('report_type', '')
-    
-    # event_type이나 report_type에서 세부 이벤트명 추출
-    for event_name, signal_config in event_signals.items():
-        if event_name in event_type or event_name in report_type:
-            action = signal_config.get("action", "NEUTRAL")
-            delay_days = signal_config.get("delay_days", 0)
-            signal_date = latest_date + timedelta(days=delay_days)
-            
-            if signal_date <= current_date:
-                if action == "BUY":
-                    buy_signals.append({
-                        "category": latest_disclosure.get('category', ''),
-                        "event_type": event_name,
-                        "disclosure_date": latest_date,
-                        "signal_date": signal_date
-                    })
-                elif action == "SELL":
-                    sell_signals.append({
-                        "category": latest_disclosure.get('category', ''),
-                        "event_type": event_name,
-                        "disclosure_date": latest_date,
-                        "signal_date": signal_date
-                    })
-                break  # 세부 이벤트 신호가 있으면 카테고리 신호보다 우선
-    
-    # 2단계: 세부 이벤트 신호가 없으면 카테고리별 신호 확인
-    if not buy_signals and not sell_signals and 'category' in latest_disclosure:
-        category = latest_disclosure.get('category', '')
-        if category in category_signals:
-            signal_config = category_signals[category]
-            action = signal_config.get("action", "NEUTRAL")
-            delay_days = signal_config.get("delay_days", 0)
-            signal_date = latest_date + timedelta(days=delay_days)
-            
-            if signal_date <= current_date:
-                if action == "BUY":
-                    buy_signals.append({
-                        "category": category,
-                        "event_type": event_type,
-                        "disclosure_date": latest_date,
-                        "signal_date": signal_date
-                    })
-                elif action == "SELL":
-                    sell_signals.append({
-                        "category": category,
-                        "event_type": event_type,
-                        "disclosure_date": latest_date,
-                        "signal_date": signal_date
-                    })
-                else:
-                    neutral_signals.append({
-                        "category": category,
-                        "event_type": event_type,
-                        "disclosure_date": latest_date,
-                        "signal_date": signal_date
-                    })
-    
-    # 3단계: 신호 우선순위 결정 (SELL > BUY > NEUTRAL)
-    if sell_signals:
-        return {
-            "action": "SELL",
-            "categories": [s["category"] for s in sell_signals],
-            "signal_date": max(s["signal_date"] for s in sell_signals),
-            "event_type": sell_signals[0]["event_type"],
-            "details": sell_signals
-        }
-    elif buy_signals:
-        return {
-            "action": "BUY",
-            "categories": [s["category"] for s in buy_signals],
-            "signal_date": max(s["signal_date"] for s in buy_signals),
-            "event_type": buy_signals[0]["event_type"],
-            "details": buy_signals
-        }
-    else:
-        return {
-            "action": "NEUTRAL",
-            "categories": [s["category"] for s in neutral_signals] if neutral_signals else [],
-            "signal_date": current_date,
-            "event_type": event_type,
-            "details": neutral_signals
-        }
+    return CategorySignalTable.from_frame(disclosure_df, category_signals, event_signals).signal_at(current_date)
 
 
 # ============================================================
@@ -1501,38 +1971,85 @@ class PortfolioStrategy(bt.Strategy):
         self.event_signals = event_signals or {}
         self.indicator_data = indicator_data or {}
         self.event_indicator_conditions = event_indicator_conditions or []
+        # bar마다 반복되는 지표 조건 확인용으로 종목별 numpy 테이블에 조건을 미리 적용해 둠
+        self.indicator_matchers: Dict[str, IndicatorConditionMatcher] = {}
+        if self.event_indicator_conditions:
+            self.indicator_matchers = {
+                sym: IndicatorConditionMatcher.build(IndicatorTable.from_frame(df), self.event_indicator_conditions)
+                for sym, df in self.indicator_data.items()
+                if df is not None and not df.empty
+            }
+        # disclosure 코드 판단용 종목별 공시 타임라인(날짜순 정렬된 데이터만 사용)
+        self.disclosure_timelines: Dict[str, DisclosureTimeline] = {
+            sym: DisclosureTimeline.from_frame(df)
+            for sym, df in self.sentiment_data.items()
+            if df is not None and not df.empty and df.index.is_monotonic_increasing
+        }
+        # 카테고리/세부 이벤트 신호도 종목별로 미리 풀어두고 bar마다 최신 공시 위치만 조회
+        self.category_signal_tables: Dict[str, CategorySignalTable] = {}
+        if self.use_dart and (self.category_signals or self.event_signals):
+            self.category_signal_tables = {
+                sym: CategorySignalTable.from_frame(df, self.category_signals, self.event_signals)
+                for sym, df in self.sentiment_data.items()
+                if df is not None and not df.empty
+            }
         self.rebalance_date = None  # 마지막 리밸런싱 날짜
+        # 리밸런싱 bar에서 시장가 청산을 낸 데이터피드(id(data)). 청산 주문은 다음 bar에 접수되므로
+        # 미체결 주문 색인에는 아직 없어, 같은 bar의 포지션 관리가 중복 청산/스탑 주문을 내지 않도록 따로 기록
+        self._rebalance_closing: set[int] = set()
+        self._rebalance_closing_date = None
+        # 같은 bar에서 rebalance(매수 판단)와 manage_position(매도 판단)이 같은 종목의 신호를
+        # 다시 계산하지 않도록 bar 단위로 결과를 보관((신호 종류, 종목) -> 결과, 날짜가 바뀌면 비움)
+        self._signal_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._signal_cache_date = None
         self.trades_log: List[Dict[str, Any]] = []  # 체결 기반 거래 내역 로그
         self._order_meta: Dict[int, Dict[str, Any]] = {}  # order.ref -> meta(reason 등)
-        
-        # 각 종목에 대한 기술적 지표 계산
+        # 브로커 대기 주문(pending)을 데이터피드별로 색인(id(data) -> orders). notify_order에서 갱신하며,
+        # 매 bar·종목마다 브로커 전체 주문 목록을 훑지 않도록 합니다.
+        self._open_orders_by_data: Dict[int, List[Any]] = {}
+        
+        # 종목 <-> 데이터피드 인덱스 매핑(list.index 선형 탐색 대신 dict 조회)
+        # data 객체의 ==는 backtrader 라인 연산으로 오버로드되어 있으므로 id(data)를 키로 사용
+        self._symbol_to_idx: Dict[str, int] = {
+            symbol: i for i, symbol in enumerate(self.selected_symbols[: len(self.datas)])
+        }
+        self._data_to_symbol: Dict[int, str] = {
+            id(data): self.selected_symbols[i]
+            for i, data in enumerate(self.datas)
+            if i < len(self.selected_symbols)
+        }
+
+        # 각 종목에 대한 기술적 지표 계산 (데이터피드 인덱스 순서의 리스트)
         # SMA(이동평균선)와 ATR(평균 진폭)을 계산하여 추세와 변동성 파악
-        self.indicators = {}
-        for i, data in enumerate(self.datas):
-            symbol = self.selected_symbols[i]
-            self.indicators[symbol] = {
-                'sma_fast': bt.indicators.SMA(data.close, period=10),  # 단기 이동평균
-                'sma_slow': bt.indicators.SMA(data.close, period=30),  # 장기 이동평균
-                'atr': bt.indicators.ATR(data, period=14),  # 평균 진폭 (변동성 지표)
-            }
+        self._sma_fast = [bt.indicators.SMA(data.close, period=10) for data in self.datas]  # 단기 이동평균
+        self._sma_slow = [bt.indicators.SMA(data.close, period=30) for data in self.datas]  # 장기 이동평균
+        self._atr = [bt.indicators.ATR(data, period=14) for data in self.datas]  # 평균 진폭 (변동성 지표)
 
     def _symbol_from_data(self, data) -> str:
         """주어진 datafeed 객체를 종목코드(symbol)로 역매핑합니다."""
-        try:
-            idx = self.datas.index(data)
-            if 0 <= idx < len(self.selected_symbols):
-                return self.selected_symbols[idx]
-        except Exception:
-            pass
+        symbol = self._data_to_symbol.get(id(data))
+        if symbol is not None:
+            return symbol
         name = getattr(data, "_name", None)
         return str(name) if name else ""
 
-    def _open_orders(self) -> List[Any]:
-        """Backtrader 버전 차이를 고려해 open orders를 안전하게 가져옵니다."""
-        try:
-            return list(self.broker.get_orders_open())
-        except Exception:
-            return list(getattr(self.broker, "orders", []) or [])
+    def _open_orders(self, data=None) -> List[Any]:
+        """브로커가 접수(Accepted)한 미체결 주문 목록. data를 주면 해당 데이터피드의 주문만 반환합니다."""
+        if data is not None:
+            return list(self._open_orders_by_data.get(id(data), ()))
+        return [o for orders in self._open_orders_by_data.values() for o in orders]
+
+    def _index_open_order(self, order) -> None:
+        """notify_order 상태에 맞춰 데이터피드별 미체결 주문 색인을 갱신합니다."""
+        key = id(getattr(order, "data", None))
+        if order.status in [order.Accepted, order.Partial]:
+            orders = self._open_orders_by_data.setdefault(key, [])
+            if order not in orders:
+                orders.append(order)
+        elif order.status in [order.Completed, order.Canceled, order.Rejected, order.Margin, order.Expired]:
+            orders = self._open_orders_by_data.get(key)
+            if orders and order in orders:
+                orders.remove(order)
 
     def _cancel_open_orders(
         self,
@@ -1541,9 +2058,7 @@ class PortfolioStrategy(bt.Strategy):
         exectypes: Optional[set[int]] = None,
     ) -> None:
         """지정한 조건의 open order를 취소합니다."""
-        for o in self._open_orders():
-            if data is not None and getattr(o, "data", None) is not data:
-                continue
+        for o in self._open_orders(data):
             if exectypes is not None and getattr(o, "exectype", None) not in exectypes:
                 continue
             if getattr(o, "status", None) in [o.Submitted, o.Accepted]:
@@ -1554,8 +2069,36 @@ class PortfolioStrategy(bt.Strategy):
                         self.cancel(o)
                     except Exception:
                         pass
+                # 취소 알림은 다음 bar에 전달되므로 색인에서는 바로 제거
+                self._index_open_order(o)
             self._order_meta.pop(getattr(o, "ref", None), None)
 
+    def _bar_signal_cache(self, date) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        if self._signal_cache_date != date:
+            self._signal_cache = {}
+            self._signal_cache_date = date
+        return self._signal_cache
+
+    def _indicator_signal(self, symbol: str, indicator_matcher: IndicatorConditionMatcher, date) -> Dict[str, Any]:
+        """지표 조건 신호(bar 단위 메모이제이션)"""
+        cache = self._bar_signal_cache(date)
+        key = ("indicator", symbol)
+        signal = cache.get(key)
+        if signal is None:
+            signal = indicator_matcher.signal_at(datetime.combine(date, datetime.min.time()))
+            cache[key] = signal
+        return signal
+
+    def _category_signal(self, symbol: str, signal_table: CategorySignalTable, date) -> Dict[str, Any]:
+        """카테고리/세부 이벤트 신호(bar 단위 메모이제이션)"""
+        cache = self._bar_signal_cache(date)
+        key = ("category", symbol)
+        signal = cache.get(key)
+        if signal is None:
+            signal = signal_table.signal_at(datetime.combine(date, datetime.min.time()))
+            cache[key] = signal
+        return signal
+
     def _track_order(self, order, *, reason: str) -> None:
         """주문 체결 시점에 사용할 메타데이터(사유 등)를 order.ref로 저장합니다."""
         if order is None:
@@ -1603,35 +2146,29 @@ class PortfolioStrategy(bt.Strategy):
         self._cancel_open_orders()
 
         # 1단계: 현재 보유 포지션 전량 청산 (체결은 다음 bar에서 발생)
+        self._rebalance_closing = set()
+        self._rebalance_closing_date = date
         for data in self.datas:
             pos = self.getposition(data)
             if pos.size != 0:
                 o = self.close(data=data)
                 self._track_order(o, reason="리밸런싱")
+                self._rebalance_closing.add(id(data))
 
         # 2단계: 매수 후보 선정 (지표 조건 > 카테고리 신호 > disclosure 코드)
         buy_plans: List[Tuple[int, str, str]] = []
 
         for i, symbol in enumerate(self.selected_symbols[: self.params.max_positions]):
             data = self.datas[i]
-            sentiment_df = self.sentiment_data.get(symbol, pd.DataFrame())
-
-            date_str = date.strftime("%Y-%m-%d")
-
             should_buy = False
             reason = ""
 
             # 1) 지표 조건 확인 (최우선순위)
             if self.use_dart and self.event_indicator_conditions:
-                indicator_df = self.indicator_data.get(symbol, pd.DataFrame())
-                if not indicator_df.empty:
+                indicator_matcher = self.indicator_matchers.get(symbol)
+                if indicator_matcher is not None:
                     try:
-                        date_dt = datetime.combine(date, datetime.min.time())
-                        indicator_signal = check_indicator_conditions(
-                            indicator_df,
-                            self.event_indicator_conditions,
-                            date_dt,
-                        )
+                        indicator_signal = self._indicator_signal(symbol, indicator_matcher, date)
                         if indicator_signal.get("action") == "BUY":
                             should_buy = True
                             report_type = indicator_signal.get("report_type", "")
@@ -1645,16 +2182,11 @@ class PortfolioStrategy(bt.Strategy):
                         pass
 
             # 2) 카테고리 신호 확인
-            if not should_buy and self.use_dart and not sentiment_df.empty:
-                if self.category_signals or self.event_signals:
+            if not should_buy and self.use_dart:
+                signal_table = self.category_signal_tables.get(symbol)
+                if signal_table is not None:
                     try:
-                        date_dt = datetime.combine(date, datetime.min.time())
-                        signal = generate_category_signals(
-                            sentiment_df,
-                            self.category_signals,
-                            self.event_signals,
-                            date_dt,
-                        )
+                        signal = self._category_signal(symbol, signal_table, date)
                         if signal.get("action") == "BUY":
                             should_buy = True
                             categories_str = (
@@ -1667,18 +2199,12 @@ class PortfolioStrategy(bt.Strategy):
                         pass
 
             # 3) disclosure 코드 확인
-            if not should_buy and self.use_dart and not sentiment_df.empty:
-                try:
-                    before_dates = sentiment_df.loc[:date_str]
-                    if len(before_dates) > 0:
-                        latest_event = before_dates.iloc[-1]
-                        disclosure = int(latest_event.get("disclosure", 0) or 0)
-                        event_type = latest_event.get("event_type", "general")
-                        if disclosure == 1:
-                            should_buy = True
-                            reason = f"긍정 이벤트: {event_type}"
-                except Exception:
-                    pass
+            timeline = self.disclosure_timelines.get(symbol)
+            if not should_buy and self.use_dart and timeline is not None:
+                row = timeline.latest_pos(date)
+                if row >= 0 and timeline.disclosure[row] == 1:
+                    should_buy = True
+                    reason = f"긍정 이벤트: {timeline.event_type[row]}"
 
             if should_buy:
                 buy_plans.append((i, symbol, reason))
@@ -1719,35 +2245,29 @@ class PortfolioStrategy(bt.Strategy):
         if pos.size == 0:
             return
 
+        # 이번 bar 리밸런싱에서 이미 청산 주문을 냈으면 추가 매도(중복 청산/스탑/리밋)로 숏이 되지 않도록 생략
+        if self._rebalance_closing_date == date and id(data) in self._rebalance_closing:
+            return
+
         # 이미 시장가 청산 주문이 대기 중이면 추가 주문(스탑/리밋 등)을 만들지 않음
-        for o in self._open_orders():
-            if getattr(o, "data", None) is data and getattr(o, "status", None) in [
+        for o in self._open_orders(data):
+            if getattr(o, "status", None) in [
                 o.Submitted,
                 o.Accepted,
             ]:
                 if getattr(o, "exectype", None) == bt.Order.Market and o.issell():
                     return
 
-        sentiment_df = self.sentiment_data.get(symbol, pd.DataFrame())
-
-        # 공시 정보 조회
-        date_str = date.strftime('%Y-%m-%d')
-        
         # 1단계: 지표 조건 > 카테고리 신호 > disclosure 코드 순으로 매도 결정
         should_sell = False
         sell_reason = ""
         
         # 1-1단계: 지표 조건 확인 (최우선순위)
         if self.use_dart and self.event_indicator_conditions:
-            indicator_df = self.indicator_data.get(symbol, pd.DataFrame())
-            if not indicator_df.empty:
+            indicator_matcher = self.indicator_matchers.get(symbol)
+            if indicator_matcher is not None:
                 try:
-                    date_dt = datetime.combine(date, datetime.min.time())
-                    indicator_signal = check_indicator_conditions(
-                        indicator_df,
-                        self.event_indicator_conditions,
-                        date_dt
-                    )
+                    indicator_signal = self._indicator_signal(symbol, indicator_matcher, date)
                     
                     if indicator_signal["action"] == "SELL":
                         should_sell = True
@@ -1759,16 +2279,11 @@ class PortfolioStrategy(bt.Strategy):
                     pass  # 지표 조건 확인 실패 시 다음 단계로
         
         # 1-2단계: 지표 조건이 없으면 카테고리별 신호 확인
-        if not should_sell and self.use_dart and not sentiment_df.empty:
-            if self.category_signals or self.event_signals:
+        if not should_sell and self.use_dart:
+            signal_table = self.category_signal_tables.get(symbol)
+            if signal_table is not None:
                 try:
-                    date_dt = datetime.combine(date, datetime.min.time())
-                    signal = generate_category_signals(
-                        sentiment_df, 
-                        self.category_signals, 
-                        self.event_signals,
-                        date_dt
-                    )
+                    signal = self._category_signal(symbol, signal_table, date)
                     
                     if signal["action"] == "SELL":
                         should_sell = True
@@ -1778,19 +2293,12 @@ class PortfolioStrategy(bt.Strategy):
                     pass
         
         # 1-3단계: 카테고리 신호가 없으면 disclosure 코드만 확인
-        if not should_sell and self.use_dart and not sentiment_df.empty:
-            try:
-                before_dates = sentiment_df.loc[:date_str]
-                if len(before_dates) > 0:
-                    latest_event = before_dates.iloc[-1]
-                    disclosure = latest_event.get('disclosure', 0)
-                    event_type = latest_event.get('event_type', 'general')
-                    
-                    if disclosure == 2:  # 부정적 이벤트
-                        should_sell = True
-                        sell_reason = f'부정 이벤트: {event_type}'
-            except:
-                pass
+        timeline = self.disclosure_timelines.get(symbol)
+        if not should_sell and self.use_dart and timeline is not None:
+            row = timeline.latest_pos(date)
+            if row >= 0 and timeline.disclosure[row] == 2:  # 부정적 이벤트
+                should_sell = True
+                sell_reason = f'부정 이벤트: {timeline.event_type[row]}'
         
         if should_sell:
             # 신호 기반 청산 시에는 기존 리스크(스탑/리밋) 주문을 우선 취소
@@ -1801,9 +2309,8 @@ class PortfolioStrategy(bt.Strategy):
         
         # 2단계: ATR 기반 스탑로스 및 이익실현 설정
         # ATR은 변동성을 나타내는 지표로, 이를 활용하여 동적 리스크 관리
-        indicators = self.indicators[symbol]
         try:
-            atr_val = float(indicators["atr"][0])
+            atr_val = float(self._atr[self._symbol_to_idx[symbol]][0])
         except Exception:
             atr_val = 0.0
         if not np.isfinite(atr_val) or atr_val <= 0:
@@ -1858,6 +2365,8 @@ class PortfolioStrategy(bt.Strategy):
         
         주문이 체결되거나 취소될 때 호출됩니다.
         """
+        self._index_open_order(order)
+
         if order.status in [order.Submitted, order.Accepted]:
             return
 
@@ -1982,46 +2491,59 @@ async def run_backtest(input_params: BacktestInput) -> BacktestOutput:
 
     # (A) 정렬 기준에 따른 스크리닝
     if input_params.sort_by in ["momentum", "market_cap", "event_type", "disclosure"]:
-        symbol_to_score = {}
-        
-        for sym in universe_symbols:
-            try:
-                if input_params.sort_by == "momentum":
-                    score = loader.get_stock_momentum_score(
-                        sym,
-                        input_params.start_date,
-                        input_params.end_date,
-                        lookback_days=20
-                    )
-                elif input_params.sort_by == "market_cap":
-                    score = loader.get_stock_market_cap_score(
-                        sym,
-                        input_params.start_date,
-                        input_params.end_date
-                    )
-                elif input_params.sort_by == "event_type":
-                    score = loader.get_event_type_score(
-                        sym,
-                        input_params.start_date,
-                        input_params.end_date
-                    )
-                elif input_params.sort_by == "disclosure":
-                    # disclosure 코드 기반 점수 (disclosure 코드 합계)
-                    df_disclosure = loader.get_dart_disclosure_data(
-                        symbol=sym,
-                        start_date=input_params.start_date,
-                        end_date=input_params.end_date
-                    )
-                    if not df_disclosure.empty and 'disclosure' in df_disclosure.columns:
-                        score = float(df_disclosure['disclosure'].sum())
-                    else:
-                        score = 0.0
-                else:
-                    score = 0.0
-                
-                symbol_to_score[sym] = score
-            except Exception as e:
-                symbol_to_score[sym] = 0.0
+        # 종목별 점수 조회는 동기 DB 호출이므로 스레드로 넘기고, screening_concurrency만큼 겹쳐 실행
+        sem = asyncio.Semaphore(max(1, int(input_params.screening_concurrency)))
+
+        if input_params.sort_by in ("event_type", "disclosure") and loader.use_dart:
+            # 종목별 공시 조회 대신 유니버스 전체를 한 번에 조회해 캐시에 채움
+            await asyncio.to_thread(
+                loader.get_dart_disclosure_batch,
+                universe_symbols,
+                input_params.start_date,
+                input_params.end_date,
+            )
+
+        def _metric_score(sym: str) -> float:
+            if input_params.sort_by == "momentum":
+                return loader.get_stock_momentum_score(
+                    sym,
+                    input_params.start_date,
+                    input_params.end_date,
+                    lookback_days=20
+                )
+            elif input_params.sort_by == "market_cap":
+                return loader.get_stock_market_cap_score(
+                    sym,
+                    input_params.start_date,
+                    input_params.end_date
+                )
+            elif input_params.sort_by == "event_type":
+                return loader.get_event_type_score(
+                    sym,
+                    input_params.start_date,
+                    input_params.end_date
+                )
+            elif input_params.sort_by == "disclosure":
+                # disclosure 코드 기반 점수 (disclosure 코드 합계)
+                df_disclosure = loader.get_dart_disclosure_data(
+                    symbol=sym,
+                    start_date=input_params.start_date,
+                    end_date=input_params.end_date
+                )
+                if not df_disclosure.empty and 'disclosure' in df_disclosure.columns:
+                    return float(df_disclosure['disclosure'].sum())
+                return 0.0
+            return 0.0
+
+        async def _metric_score_one(sym: str) -> Tuple[str, float]:
+            async with sem:
+                try:
+                    return sym, await asyncio.to_thread(_metric_score, sym)
+                except Exception:
+                    return sym, 0.0
+
+        scored = await asyncio.gather(*[_metric_score_one(s) for s in universe_symbols])
+        symbol_to_score = {s: v for s, v in scored}
         
         # filter_type / filter_percent / filter_value 적용 + 정렬
         screened = _apply_metric_filter_and_sort(
@@ -2047,6 +2569,19 @@ async def run_backtest(input_params: BacktestInput) -> BacktestOutput:
         # 레거시: 감성점수 기반 (disclosure 코드 기반으로 계산)
         sem = asyncio.Semaphore(max(1, int(input_params.screening_concurrency)))
 
+        if loader.use_dart:
+            # 점수 계산과 같은 lookback 윈도우로 유니버스 공시를 한 번에 조회해 캐시에 채움
+            await asyncio.to_thread(
+                loader.get_dart_disclosure_batch,
+                universe_symbols,
+                _screening_window_start(
+                    input_params.start_date,
+                    input_params.end_date,
+                    int(input_params.sentiment_screening_days),
+                ),
+                input_params.end_date,
+            )
+
         async def _score_one(sym: str) -> Tuple[str, float]:
             async with sem:
                 score = await loader.get_sentiment_screening_score(
@@ -2127,6 +2662,13 @@ async def run_backtest(input_params: BacktestInput) -> BacktestOutput:
     sentiment_data = {}
     indicator_data = {}
     
+    if input_params.use_dart_disclosure:
+        # 종목별 공시 조회를 한 번의 쿼리로 미리 채움(스크리닝에서 이미 조회한 종목은 캐시 재사용)
+        loader.get_dart_disclosure_batch(selected_symbols, input_params.start_date, input_params.end_date)
+    if input_params.use_dart_disclosure and input_params.event_indicator_conditions:
+        # 지표 조회에 쓰는 회사명을 종목별로 따로 조회하지 않도록 미리 일괄 조회
+        loader.prefetch_corp_names(selected_symbols)
+
     for symbol in selected_symbols:
         # 주가 데이터 조회
         df_price = loader.get_stock_price_data(
@@ -2323,16 +2865,16 @@ async def run_backtest(input_params: BacktestInput) -> BacktestOutput:
     
     # BUY와 SELL을 매칭하여 손익 계산
     completed_trades = []
-    buy_dict = {}  # symbol -> list of buy records
+    buy_dict: Dict[str, deque] = {}  # symbol -> FIFO queue of buy records
     for t in trades_log:
         symbol = t['symbol']
         if t['action'] == 'BUY':
             if symbol not in buy_dict:
-                buy_dict[symbol] = []
+                buy_dict[symbol] = deque()
             buy_dict[symbol].append(t)
         elif t['action'] == 'SELL':
             if symbol in buy_dict and buy_dict[symbol]:
-                buy_record = buy_dict[symbol].pop(0)  # FIFO
+                buy_record = buy_dict[symbol].popleft()  # FIFO
                 pnl = (t['price'] - buy_record['price']) * t['size']
                 completed_trades.append({
                     'symbol': symbol,
@@ -2438,7 +2980,7 @@ def analyze_event_performance(
     if is_completed:
         completed_trades = list(trades)
     else:
-        buy_dict: Dict[str, List[Dict[str, Any]]] = {}
+        buy_dict: Dict[str, deque] = {}
         for t in trades:
             if not isinstance(t, dict):
                 continue
@@ -2447,11 +2989,11 @@ def analyze_event_performance(
             if not symbol or action not in ("BUY", "SELL"):
                 continue
             if action == "BUY":
-                buy_dict.setdefault(symbol, []).append(t)
+                buy_dict.setdefault(symbol, deque()).append(t)
                 continue
             if action == "SELL":
                 if symbol in buy_dict and buy_dict[symbol]:
-                    buy_record = buy_dict[symbol].pop(0)
+                    buy_record = buy_dict[symbol].popleft()
                     try:
                         pnl = (float(t.get("price", 0.0)) - float(buy_record.get("price", 0.0))) * float(
                             t.get("size", 0.0)
@@ -2467,6 +3009,9 @@ def analyze_event_performance(
                         }
                     )
 
+    # 종목별 공시 일자 문자열 집합(거래마다 전체 인덱스를 strftime하지 않도록 1회만 계산)
+    date_keys_by_symbol: Dict[str, frozenset] = {}
+
     # completed_trades 기반으로 이벤트별 통계 집계
     for t in completed_trades:
         symbol = t.get("symbol")
@@ -2478,7 +3023,11 @@ def analyze_event_performance(
             sentiment_df = sentiment_data[symbol]
             date_str = pd.to_datetime(ref_date).strftime("%Y-%m-%d")
             try:
-                if date_str in sentiment_df.index.strftime("%Y-%m-%d").values:
+                date_keys = date_keys_by_symbol.get(symbol)
+                if date_keys is None:
+                    date_keys = frozenset(sentiment_df.index.strftime("%Y-%m-%d"))
+                    date_keys_by_symbol[symbol] = date_keys
+                if date_str in date_keys:
                     row = sentiment_df.loc[date_str]
                     if isinstance(row, pd.Series):
                         event_type = row.get("event_type", "general") or "general"
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
 import os
 import re
 import uuid
 from typing import Any, Dict, Optional
 
 import asyncpg
+import orjson
+
+logger = logging.getLogger(__name__)
 
 # ============================================================
 # Auto init (optional): create/alter table if missing
@@ -117,6 +121,31 @@ async def ensure_backtesting_table(*, conn: asyncpg.Connection, schema: str, tab
     await conn.execute(
         f"CREATE INDEX IF NOT EXISTS backtesting_analysis_status_created_at_idx ON {schema}.{table} (analysis_status, created_at DESC)"
     )
+    # 워커 점유 쿼리(claim_next_pending_job)용 부분 인덱스: pending row만 인덱싱
+    await conn.execute(
+        f"CREATE INDEX IF NOT EXISTS backtesting_pending_created_at_idx ON {schema}.{table} (created_at) WHERE status = 'pending'"
+    )
+
+
+# ensure_backtesting_table은 프로세스당 (schema, table)별 1회만 실행합니다.
+# (매 insert마다 DDL 4~5회 왕복을 반복하지 않도록)
+# asyncio.Lock은 처음 대기한 루프에 묶이므로 커넥션 풀과 같이 이벤트 루프별로 둡니다.
+_initialized_tables: set[tuple[str, str]] = set()
+_init_locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+
+async def _ensure_backtesting_table_once(*, conn: asyncpg.Connection, schema: str, table: str) -> None:
+    key = (schema, table)
+    if key in _initialized_tables:
+        return
+    lock = _init_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+    async with lock:
+        if key in _initialized_tables:
+            return
+        await ensure_backtesting_table(conn=conn, schema=schema, table=table)
+        # 실패 시 플래그를 세우지 않으므로 다음 호출에서 재시도됩니다.
+        _initialized_tables.add(key)
+
 
 # ============================================================
 # stockelper_web DB helpers (asyncpg)
@@ -142,6 +171,25 @@ def _get_table() -> str:
     return table
 
 
+def _json_dumps(value: Any) -> str:
+    """jsonb 파라미터 직렬화(orjson). NaN/Infinity는 jsonb가 거부하므로 null로 기록됩니다."""
+    return orjson.dumps(
+        value,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    ).decode("utf-8")
+
+
+def _get_notify_channel() -> Optional[str]:
+    """신규 job 생성 알림(NOTIFY) 채널. 빈 값이면 알림을 보내지 않습니다."""
+    channel = os.getenv("STOCKELPER_BACKTESTING_NOTIFY_CHANNEL", "backtesting_job_created").strip()
+    if not channel:
+        return None
+    if not _TABLE_NAME_RE.match(channel):
+        raise ValueError(f"Invalid STOCKELPER_BACKTESTING_NOTIFY_CHANNEL: {channel!r}")
+    return channel
+
+
 def _get_database_url_for_asyncpg() -> str:
     """DATABASE_URL / ASYNC_DATABASE_URL을 asyncpg DSN으로 변환해 반환."""
     url = os.getenv("DATABASE_URL") or os.getenv("ASYNC_DATABASE_URL")
@@ -154,6 +202,74 @@ def _get_database_url_for_asyncpg() -> str:
     return url
 
 
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)) or default)
+    except Exception:
+        return default
+
+
+# 호출마다 새 커넥션을 맺으면 asyncpg prepared statement 캐시가 매번 버려지므로,
+# 이벤트 루프별로 커넥션 풀을 하나 두고 재사용합니다(asyncpg 풀은 생성한 루프에서만 사용/종료 가능).
+_pools: Dict[asyncio.AbstractEventLoop, asyncpg.Pool] = {}
+_pool_locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+
+def _terminate_pool(pool: asyncpg.Pool) -> None:
+    # 이미 멈춘/종료된 루프의 풀은 await로 닫을 수 없으므로 커넥션을 즉시 끊습니다(best-effort).
+    try:
+        pool.terminate()
+    except Exception:
+        pass
+
+
+def _discard_closed_loop_pools() -> None:
+    for loop in [lp for lp in _pools if lp.is_closed()]:
+        _pool_locks.pop(loop, None)
+        _terminate_pool(_pools.pop(loop))
+    for loop in [lp for lp in _init_locks if lp.is_closed()]:
+        del _init_locks[loop]
+
+
+async def _get_pool() -> asyncpg.Pool:
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is not None:
+        return pool
+    _discard_closed_loop_pools()
+    lock = _pool_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        pool = _pools.get(loop)
+        if pool is None:
+            pool = await asyncpg.create_pool(
+                _get_database_url_for_asyncpg(),
+                min_size=max(0, _env_int("STOCKELPER_WEB_DB_POOL_MIN_SIZE", 1)),
+                max_size=max(1, _env_int("STOCKELPER_WEB_DB_POOL_MAX_SIZE", 10)),
+                # PgBouncer(transaction pooling) 환경에서는 0으로 두어 prepared statement를 끕니다.
+                statement_cache_size=max(0, _env_int("STOCKELPER_WEB_DB_STATEMENT_CACHE_SIZE", 1024)),
+            )
+            _pools[loop] = pool
+    return pool
+
+
+async def close_pool() -> None:
+    """프로세스 종료 시 모든 이벤트 루프의 커넥션 풀을 정리합니다(API lifespan/워커 종료 시 호출)."""
+
+    current = asyncio.get_running_loop()
+    pools = list(_pools.items())
+    _pools.clear()
+    _pool_locks.clear()
+    _init_locks.clear()
+    for loop, pool in pools:
+        if loop is current:
+            await pool.close()
+        elif loop.is_running():
+            # 다른 스레드에서 실행 중인 루프의 풀은 그 루프에서 닫습니다.
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(pool.close(), loop))
+        else:
+            _terminate_pool(pool)
+
+
 async def insert_backtesting_job(
     *,
     user_id: int,
@@ -166,32 +282,39 @@ async def insert_backtesting_job(
     job_id = str(uuid.uuid4())
     schema = _get_schema()
     table = _get_table()
-    dsn = _get_database_url_for_asyncpg()
+    pool = await _get_pool()
 
-    conn = await asyncpg.connect(dsn)
-    try:
+    async with pool.acquire() as conn:
         # (옵션) 테이블 자동 생성/보강
         if _auto_init_enabled():
-            await ensure_backtesting_table(conn=conn, schema=schema, table=table)
+            await _ensure_backtesting_table_once(conn=conn, schema=schema, table=table)
 
-        # created_at은 DEFAULT now() 를 권장. (없다면 아래에서 직접 넣도록 DDL을 맞춰주세요)
-        await conn.execute(
-            f"""
-            INSERT INTO {schema}.{table}
-              (id, job_id, user_id, request_source, status, input_json, output_json, updated_at)
-            VALUES
-              ($1, $2, $3, $4, $5, $6, $7, CURRENT_TIMESTAMP)
-            """,
+        args = (
             rec_id,
             job_id,
             int(user_id),
             str(request_source),
             "pending",
-            json.dumps(input_json, ensure_ascii=False, default=str),
-            json.dumps({}, ensure_ascii=False),
+            _json_dumps(input_json),
+            _json_dumps({}),
         )
-    finally:
-        await conn.close()
+        # created_at은 DEFAULT now() 를 권장. (없다면 아래에서 직접 넣도록 DDL을 맞춰주세요)
+        insert_sql = f"""
+            INSERT INTO {schema}.{table}
+              (id, job_id, user_id, request_source, status, input_json, output_json, updated_at)
+            VALUES
+              ($1, $2, $3, $4, $5, $6, $7, CURRENT_TIMESTAMP)
+            """
+        channel = _get_notify_channel()
+        if channel:
+            # INSERT와 NOTIFY를 한 statement로 보내 대기 중인 워커를 즉시 깨웁니다(추가 왕복 없음).
+            await conn.execute(
+                f"WITH ins AS ({insert_sql} RETURNING job_id) SELECT pg_notify($8, job_id) FROM ins",
+                *args,
+                channel,
+            )
+        else:
+            await conn.execute(insert_sql, *args)
 
     return {"id": rec_id, "job_id": job_id, "status": "pending"}
 
@@ -201,10 +324,9 @@ async def get_backtesting_job(*, job_id: str, user_id: int) -> Optional[Dict[str
 
     schema = _get_schema()
     table = _get_table()
-    dsn = _get_database_url_for_asyncpg()
+    pool = await _get_pool()
 
-    conn = await asyncpg.connect(dsn)
-    try:
+    async with pool.acquire() as conn:
         row = await conn.fetchrow(
             f"""
             SELECT
@@ -251,7 +373,7 @@ async def get_backtesting_job(*, job_id: str, user_id: int) -> Optional[Dict[str
                 data[k] = {}
             elif isinstance(v, str):
                 try:
-                    data[k] = json.loads(v)
+                    data[k] = orjson.loads(v)
                 except Exception:
                     data[k] = {}
             elif not isinstance(v, dict):
@@ -270,8 +392,56 @@ async def get_backtesting_job(*, job_id: str, user_id: int) -> Optional[Dict[str
             if v is not None:
                 data[k] = v.isoformat()
         return data
-    finally:
-        await conn.close()
+
+
+class PendingJobListener:
+    """워커용: 신규 job NOTIFY를 LISTEN하여 폴링 대기를 조기에 깨웁니다.
+
+    - 전용 커넥션(풀 밖)을 사용합니다. 접속/LISTEN에 실패하면 단순 sleep 폴링으로 동작합니다.
+    - 알림은 "깨우기" 신호일 뿐이며, 실제 점유는 여전히 `claim_next_pending_job`이 수행합니다.
+    """
+
+    def __init__(self) -> None:
+        self._channel = _get_notify_channel()
+        self._conn: Optional[asyncpg.Connection] = None
+        self._event = asyncio.Event()
+
+    def _on_notify(self, *_: Any) -> None:
+        self._event.set()
+
+    async def _ensure_listening(self) -> bool:
+        if not self._channel:
+            return False
+        if self._conn is not None and not self._conn.is_closed():
+            return True
+        try:
+            self._conn = await asyncpg.connect(_get_database_url_for_asyncpg())
+            await self._conn.add_listener(self._channel, self._on_notify)
+            return True
+        except Exception as e:
+            logger.warning("LISTEN %s failed; falling back to polling: %s", self._channel, e)
+            await self.close()
+            return False
+
+    async def wait(self, timeout: float) -> None:
+        """알림이 오거나 timeout이 지날 때까지 대기합니다."""
+        if not await self._ensure_listening():
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._event.clear()
+
+    async def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.close()
+            except Exception:
+                pass
 
 
 async def claim_next_pending_job() -> Optional[Dict[str, Any]]:
@@ -279,10 +449,9 @@ async def claim_next_pending_job() -> Optional[Dict[str, Any]]:
 
     schema = _get_schema()
     table = _get_table()
-    dsn = _get_database_url_for_asyncpg()
+    pool = await _get_pool()
 
-    conn = await asyncpg.connect(dsn)
-    try:
+    async with pool.acquire() as conn:
         row = await conn.fetchrow(
             f"""
             WITH picked AS (
@@ -309,8 +478,6 @@ async def claim_next_pending_job() -> Optional[Dict[str, Any]]:
         if not row:
             return None
         return dict(row)
-    finally:
-        await conn.close()
 
 
 async def mark_job_completed(
@@ -323,10 +490,9 @@ async def mark_job_completed(
 ) -> bool:
     schema = _get_schema()
     table = _get_table()
-    dsn = _get_database_url_for_asyncpg()
+    pool = await _get_pool()
 
-    conn = await asyncpg.connect(dsn)
-    try:
+    async with pool.acquire() as conn:
         res = await conn.execute(
             f"""
             UPDATE {schema}.{table}
@@ -341,14 +507,12 @@ async def mark_job_completed(
             WHERE job_id = $1
             """,
             str(job_id),
-            json.dumps(output_json, ensure_ascii=False, default=str),
+            _json_dumps(output_json),
             result_file_path,
             report_file_path,
             elapsed_seconds,
         )
         return str(res).strip().endswith("1")
-    finally:
-        await conn.close()
 
 
 async def mark_job_completed_with_analysis(
@@ -382,10 +546,9 @@ async def mark_job_completed_with_analysis(
 
     schema = _get_schema()
     table = _get_table()
-    dsn = _get_database_url_for_asyncpg()
+    pool = await _get_pool()
 
-    conn = await asyncpg.connect(dsn)
-    try:
+    async with pool.acquire() as conn:
         res = await conn.execute(
             f"""
             UPDATE {schema}.{table}
@@ -410,19 +573,17 @@ async def mark_job_completed_with_analysis(
             WHERE job_id = $1
             """,
             str(job_id),
-            json.dumps(output_json, ensure_ascii=False, default=str),
+            _json_dumps(output_json),
             result_file_path,
             report_file_path,
             elapsed_seconds,
             str(analysis_md or ""),
-            json.dumps(analysis_json or {}, ensure_ascii=False, default=str),
+            _json_dumps(analysis_json or {}),
             analysis_model,
             analysis_prompt_version,
             analysis_elapsed_seconds,
         )
         return str(res).strip().endswith("1")
-    finally:
-        await conn.close()
 
 
 async def mark_job_failed(
@@ -433,10 +594,9 @@ async def mark_job_failed(
 ) -> bool:
     schema = _get_schema()
     table = _get_table()
-    dsn = _get_database_url_for_asyncpg()
+    pool = await _get_pool()
 
-    conn = await asyncpg.connect(dsn)
-    try:
+    async with pool.acquire() as conn:
         res = await conn.execute(
             f"""
             UPDATE {schema}.{table}
@@ -452,6 +612,4 @@ async def mark_job_failed(
             elapsed_seconds,
         )
         return str(res).strip().endswith("1")
-    finally:
-        await conn.close()
 
@@ -3,10 +3,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
 from backtesting.agents.orchestrator import process_job
-from backtesting.web_db import claim_next_pending_job
+from backtesting.web_db import PendingJobListener, claim_next_pending_job, close_pool
 
 logger = logging.getLogger(__name__)
 
@@ -24,24 +25,90 @@ async def _process_one(job: Dict[str, Any]) -> None:
     await process_job(job)
 
 
+def _configure_openai_client() -> None:
+    """워커 전역에서 하나의 OpenAI 클라이언트(keep-alive 커넥션 풀)를 공유하도록 설정합니다."""
+
+    import httpx
+    from agents import set_default_openai_client
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    keepalive = int(os.getenv("BACKTEST_OPENAI_MAX_KEEPALIVE", "32") or 32)
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=max(1, keepalive),
+            max_connections=max(1, keepalive) * 2,
+        )
+    )
+    set_default_openai_client(AsyncOpenAI(http_client=http_client))
+
+
+async def _claim_jobs(limit: int) -> List[Dict[str, Any]]:
+    jobs: List[Dict[str, Any]] = []
+    for _ in range(max(1, limit)):
+        job = await claim_next_pending_job()
+        if not job:
+            break
+        jobs.append(job)
+    return jobs
+
+
+async def _run_job(job: Dict[str, Any]) -> None:
+    try:
+        await _process_one(job)
+    except Exception:
+        # process_job 내부에서 persist_failed로 마킹하려고 시도합니다.
+        # 여기서는 워커 루프가 죽지 않도록만 보장합니다.
+        logger.exception("worker failed while processing job: %s", job)
+
+
+async def _run_loop(*, concurrency: int, poll_seconds: float, listener: PendingJobListener) -> None:
+    """최대 concurrency개의 job을 동시에 처리하며, job이 끝나 슬롯이 비는 즉시 새 job을 점유합니다."""
+
+    concurrency = max(1, concurrency)
+    running: set[asyncio.Task[None]] = set()
+    try:
+        while True:
+            free = concurrency - len(running)
+            if free > 0:
+                for job in await _claim_jobs(free):
+                    task = asyncio.create_task(_run_job(job))
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+
+            if len(running) >= concurrency:
+                # 슬롯이 모두 찼으면 하나라도 끝날 때까지 대기(배치 전체를 기다리지 않음)
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            else:
+                # 대기 job을 모두 점유했음: 신규 job NOTIFY가 오면 poll_seconds를 기다리지 않고 바로 점유를 시도합니다.
+                await listener.wait(poll_seconds)
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
 async def main() -> None:
     # Agents-only: 워커 기동 전에 필수 키를 검증하여, 잡을 잘못 실패 처리하지 않도록 합니다.
     _require_env("OPENAI_API_KEY")
 
     poll_seconds = float(os.getenv("BACKTEST_WORKER_POLL_SECONDS", "5") or 5)
 
-    while True:
-        job = await claim_next_pending_job()
-        if not job:
-            await asyncio.sleep(poll_seconds)
-            continue
-
-        try:
-            await _process_one(job)
-        except Exception:
-            # process_job 내부에서 persist_failed로 마킹하려고 시도합니다.
-            # 여기서는 워커 루프가 죽지 않도록만 보장합니다.
-            logger.exception("worker failed while processing job: %s", job)
+    # 동기 DB 도구(preflight/종목 해석/artifact 쓰기)는 스레드로 실행되므로 풀 크기를 제한합니다.
+    threads = int(os.getenv("BACKTEST_WORKER_THREADS", "8") or 8)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max(1, threads), thread_name_prefix="backtest-tool")
+    )
+
+    # 한 번에 점유/동시 처리할 job 수(LLM 대기 구간을 겹쳐 처리량 향상)
+    concurrency = int(os.getenv("BACKTEST_WORKER_CONCURRENCY", "1") or 1)
+    _configure_openai_client()
+
+    listener = PendingJobListener()
+    try:
+        await _run_loop(concurrency=concurrency, poll_seconds=poll_seconds, listener=listener)
+    finally:
+        await listener.close()
+        await close_pool()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,14 @@
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 
 import dotenv
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backtesting.web_db import close_pool
 from routers.backtesting import api_router as backtesting_api_router
 from routers.backtesting import router as backtesting_router
 from routers.base import router as base_router
@@ -27,8 +29,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    # 종료 시 stockelper_web asyncpg 커넥션 풀 정리
+    await close_pool()
+
+
 # FastAPI 애플리케이션 생성
-app = FastAPI(debug=DEBUG)
+app = FastAPI(debug=DEBUG, lifespan=lifespan)
 
 # CORS 미들웨어 설정
 app.add_middleware(
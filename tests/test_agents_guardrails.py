@@ -0,0 +1,21 @@
+from backtesting.agents.guardrails import _scan_sensitive
+
+
+def test_scan_sensitive_detects_secret_and_dsn():
+    assert _scan_sensitive("삼성전자 2024년 백테스트") == (False, False)
+    assert _scan_sensitive("key=sk-abcdefghij1234") == (True, False)
+    assert _scan_sensitive("POSTGRESQL+psycopg://u:p@h:5432/db") == (False, True)
+    assert _scan_sensitive("sk-abcdefghij1234 postgresql://u:p@h/db") == (True, True)
+
+
+def test_param_guardrails_normalize_dates_and_ascii_symbols():
+    from backtesting.agents.orchestrator import _apply_param_guardrails
+
+    params = _apply_param_guardrails(
+        {"target_symbols": ["005930", "００５９３０", " 000660 "], "start_date": "2024-12-1", "end_date": "2024-1-1"}
+    )
+    assert params["target_symbols"] == ["000660", "005930"]
+    assert (params["start_date"], params["end_date"]) == ("2024-01-01", "2024-12-01")
+
+    params = _apply_param_guardrails({"start_date": "2024-02-30", "end_date": "2024/01/01"})
+    assert "start_date" not in params and "end_date" not in params
@@ -21,7 +21,7 @@ def _noop_trace(*args, **kwargs):
 
 
 @pytest.mark.asyncio
-async def test_process_job_happy_path(monkeypatch):
+async def test_process_job_happy_path(monkeypatch, tmp_path):
     """
     네트워크/DB 없이 Agents 파이프라인의 제어 흐름이 정상적으로 completed까지 가는지 검증합니다.
     (Runner.run 및 DB/백테스트/파일 IO는 모두 모킹)
@@ -31,6 +31,7 @@ async def test_process_job_happy_path(monkeypatch):
     from backtesting.agents.schemas import AuditResult, FinalNarrative, ParsedRequest
 
     os.environ["OPENAI_API_KEY"] = "test-key"
+    monkeypatch.setenv("BACKTEST_RESULTS_DIR", str(tmp_path))
 
     # 1) Runner/trace 모킹 (LLM 호출 방지)
     async def _fake_runner_run(agent, input_text: str, context=None):
@@ -66,16 +67,18 @@ async def test_process_job_happy_path(monkeypatch):
     monkeypatch.setattr(orch, "trace", _noop_trace)
 
     # 2) Tool impl 모킹 (DB/백테스트/파일 IO 방지)
+    #    orchestrator는 _get_tools()로 tools 모듈을 지연 로드하므로 tools 모듈을 patch
+    from backtesting.agents import tools as tools_mod
+
     monkeypatch.setattr(
-        orch,
+        tools_mod,
         "resolve_symbols_impl",
         lambda corp_names=None, query=None: {"symbols": ["005930"], "mapping_log": {}},
     )
-    monkeypatch.setattr(
-        orch,
-        "preflight_data_check_impl",
-        lambda backtest_params: {"ok": True, "warnings": []},
-    )
+    async def _fake_preflight_data_check_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"ok": True, "warnings": []}
+
+    monkeypatch.setattr(tools_mod, "preflight_data_check_impl", _fake_preflight_data_check_impl)
 
     async def _fake_run_backtest_impl(*, backtest_params: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -91,15 +94,12 @@ async def test_process_job_happy_path(monkeypatch):
             "report": "engine_report",
         }
 
-    monkeypatch.setattr(orch, "run_backtest_impl", _fake_run_backtest_impl)
-
-    # build_artifacts_impl은 orchestrator 내부에서 tools로부터 동적 import 되므로 tools 모듈을 patch
-    from backtesting.agents import tools as tools_mod
+    monkeypatch.setattr(tools_mod, "run_backtest_impl", _fake_run_backtest_impl)
 
     monkeypatch.setattr(
         tools_mod,
         "build_artifacts_impl",
-        lambda job_id, output_dict: {
+        lambda job_id, output_dict, summary=None: {
             "files": {
                 "result_file_path": f"/tmp/{job_id}.json",
                 "report_file_path": f"/tmp/{job_id}.md",
@@ -153,6 +153,34 @@ async def test_process_job_happy_path(monkeypatch):
     assert captured["analysis_json"] == {"ok": True}
 
 
+@pytest.mark.asyncio
+async def test_process_job_marks_failed_when_tools_import_fails(monkeypatch):
+    """tools(portfolio_backtest) import가 실패해도 job이 running으로 남지 않고 failed로 적재되는지 검증합니다."""
+
+    from backtesting.agents import orchestrator as orch
+
+    os.environ["OPENAI_API_KEY"] = "test-key"
+
+    def _broken_get_tools():
+        raise ImportError("backtrader")
+
+    monkeypatch.setattr(orch, "_get_tools", _broken_get_tools)
+    monkeypatch.setattr(orch, "trace", _noop_trace)
+
+    failed: Dict[str, Any] = {}
+
+    async def _fake_persist_failed_impl(*, job_id: str, error_message: str, elapsed_seconds: Optional[float]) -> bool:
+        failed["job_id"] = job_id
+        failed["error_message"] = error_message
+        return True
+
+    monkeypatch.setattr(orch, "persist_failed_impl", _fake_persist_failed_impl)
+
+    await orch.process_job({"job_id": "job-2", "user_id": 1, "input_json": {"user_id": 1}})
+
+    assert failed == {"job_id": "job-2", "error_message": "backtrader"}
+
+
 @pytest.mark.asyncio
 async def test_worker_requires_openai_api_key(monkeypatch):
     """Agents-only worker가 OPENAI_API_KEY 없으면 fail-fast하는지 검증합니다."""
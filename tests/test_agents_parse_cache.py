@@ -0,0 +1,40 @@
+import time
+
+from backtesting.agents.cache import TTLCache, parse_cache_key
+
+
+def test_parse_cache_key_is_stable_and_ignores_user_id():
+    a = parse_cache_key(
+        prompt_version="v1",
+        model="",
+        payload={"user_id": 1, "query": "삼성전자 3년치 백테스트", "parameters": {"b": 1, "a": 2}},
+    )
+    b = parse_cache_key(
+        prompt_version="v1",
+        model="",
+        payload={"parameters": {"a": 2, "b": 1}, "query": "삼성전자 3년치 백테스트", "user_id": 2},
+    )
+    c = parse_cache_key(
+        prompt_version="v2",
+        model="",
+        payload={"query": "삼성전자 3년치 백테스트", "parameters": {"a": 2, "b": 1}},
+    )
+    assert a == b
+    assert a != c
+
+
+def test_parse_cache_ttl_and_lru(monkeypatch):
+    cache = TTLCache(maxsize=2)
+    cache.setex("a", 10, "A")
+    cache.setex("b", 10, "B")
+    assert cache.get("a") == "A"  # a를 최근 사용으로 갱신
+    cache.setex("c", 10, "C")  # 가장 오래된 b가 제거됨
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("a") is None
+
+    cache.setex("d", 0, "D")  # ttl<=0이면 저장하지 않음
+    assert cache.get("d") is None
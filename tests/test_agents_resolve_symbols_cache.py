@@ -0,0 +1,24 @@
+from backtesting.agents import tools as tools_mod
+from backtesting.agents.cache import resolve_symbols_cache
+
+
+def test_resolve_symbols_impl_caches_by_canonical_key(monkeypatch):
+    resolve_symbols_cache.clear()
+    calls = []
+
+    def _fake_uncached(*, corp_names, query):
+        calls.append((corp_names, query))
+        return {"symbols": ["005930"], "mapping_log": {"by_corp_name": {}, "by_query_tokens": {}}}
+
+    monkeypatch.setattr(tools_mod, "_resolve_symbols_uncached", _fake_uncached)
+
+    a = tools_mod.resolve_symbols_impl(corp_names=["삼성전자", "SK하이닉스"], query="백테스트 ")
+    b = tools_mod.resolve_symbols_impl(corp_names=[" SK하이닉스", "삼성전자"], query="백테스트")
+    assert a == b
+    assert len(calls) == 1
+
+    # 반환값을 수정해도 캐시에는 영향이 없어야 함
+    b["symbols"].append("000660")
+    c = tools_mod.resolve_symbols_impl(corp_names=["삼성전자", "SK하이닉스"], query="백테스트")
+    assert c["symbols"] == ["005930"]
+    resolve_symbols_cache.clear()
@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+
+from backtesting import portfolio_backtest as pb
+
+# score_table_dart_idc 조회 결과(rcept_no 단위로 중복 제거된 행)
+_DISCLOSURE_ROWS = pd.DataFrame(
+    {
+        "rcept_dt": pd.to_datetime(
+            ["2024-01-03", "2024-01-03", "2024-01-05", "2024-01-04", "2024-01-10"]
+        ).date,
+        "stock_code": ["005930", "005930", "005930", "000660", "000660"],
+        "corp_name": ["삼성전자", "삼성전자", "삼성전자", "SK하이닉스", "SK하이닉스"],
+        "report_type": ["자기주식 처분 결정", "자기주식 취득 결정", "합병 결정", "감자 결정", "기타공시"],
+        "category": ["자본변동", "주주환원", "기타", "자본변동", None],
+        "rcept_no": ["20240103000001", "20240103000002", "20240105000001", "20240104000001", "20240110000001"],
+    }
+)
+
+
+class _StubEngine:
+    @contextmanager
+    def connect(self):
+        yield None
+
+
+def _fake_read_sql(query, conn, params=None, **kwargs):
+    rows = _DISCLOSURE_ROWS
+    if "symbols" in params:
+        rows = rows[rows["stock_code"].isin(params["symbols"])]
+    else:
+        rows = rows[rows["stock_code"] == params["symbol"]]
+    rows = rows[(rows["rcept_dt"] >= params["start_date"]) & (rows["rcept_dt"] <= params["end_date"])]
+    return rows.sort_values(["rcept_dt", "rcept_no"]).reset_index(drop=True)
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    monkeypatch.setattr(pb.pd, "read_sql", _fake_read_sql)
+    loader = pb.DataLoader(pb.BacktestInput(use_dart_disclosure=True))
+    loader.pg_engine = _StubEngine()
+    return loader
+
+
+def test_cached_disclosures_are_returned_as_copies(loader):
+    first = loader.get_dart_disclosure_data(symbol="005930", start_date="2024-01-01", end_date="2024-01-31")
+    first["extra"] = 1
+    first.iloc[0, first.columns.get_loc("disclosure")] = -1
+
+    second = loader.get_dart_disclosure_data(symbol="005930", start_date="2024-01-01", end_date="2024-01-31")
+    assert "extra" not in second.columns
+    assert (second["disclosure"] != -1).all()
+
+    empty = loader.get_dart_disclosure_data(symbol="035720", start_date="2024-01-01", end_date="2024-01-31")
+    empty["extra"] = 1
+    assert "extra" not in pb._empty_dart_df().columns
+
+
+def test_disclosure_batch_matches_per_symbol_loader(loader, monkeypatch):
+    symbols = ["005930", "000660", "035720"]  # 035720은 공시 없음
+    batch = loader.get_dart_disclosure_batch(symbols, "2024-01-01", "2024-01-31")
+    assert list(batch) == symbols
+
+    single = pb.DataLoader(pb.BacktestInput(use_dart_disclosure=True))
+    single.pg_engine = _StubEngine()
+    for sym in symbols:
+        expected = single.get_dart_disclosure_data(symbol=sym, start_date="2024-01-01", end_date="2024-01-31")
+        pd.testing.assert_frame_equal(batch[sym], expected)
+
+    # 같은 날짜 공시 2건은 1일 1행으로 축약(부정 공시 우선)
+    assert batch["005930"].index.is_unique
+    assert batch["005930"].loc["2024-01-03", "disclosure"] == 2
+    assert batch["035720"].empty
+
+    # 배치로 채운 캐시는 종목별 조회에서 DB를 다시 읽지 않음
+    monkeypatch.setattr(pb.pd, "read_sql", lambda *a, **k: pytest.fail("unexpected query"))
+    cached = loader.get_dart_disclosure_data(symbol="000660", start_date="2024-01-01", end_date="2024-01-31")
+    pd.testing.assert_frame_equal(cached, batch["000660"])
@@ -0,0 +1,82 @@
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+from backtesting.portfolio_backtest import PortfolioStrategy
+
+
+def _price_feed(n: int = 40) -> bt.feeds.PandasData:
+    close = np.linspace(10000.0, 11000.0, n)
+    df = pd.DataFrame(
+        {"open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": 1000.0},
+        index=pd.bdate_range("2024-01-01", periods=n),
+    )
+    return bt.feeds.PandasData(dataname=df)
+
+
+def _run(strategy_cls) -> PortfolioStrategy:
+    cerebro = bt.Cerebro()
+    cerebro.broker.setcash(1e8)
+    cerebro.adddata(_price_feed(), name="005930")
+    cerebro.addstrategy(strategy_cls, selected_symbols=["005930"], sentiment_data={}, use_dart=False)
+    return cerebro.run()[0]
+
+
+class _CancelAcceptedOrder(PortfolioStrategy):
+    def next(self):
+        self.bar = getattr(self, "bar", 0) + 1
+        if self.bar == 1:
+            # 체결되지 않을 가격의 지정가 매수: 제출된 bar에서는 아직 브로커가 접수하지 않아 색인에 없음
+            self.placed = self.buy(data=self.data, exectype=bt.Order.Limit, price=1.0, size=1)
+            self._track_order(self.placed, reason="테스트")
+            self.indexed_on_submit = self.placed in self._open_orders(self.data)
+        elif self.bar == 2:
+            self.indexed_after_accept = self.placed in self._open_orders(self.data)
+            self._cancel_open_orders(data=self.data, exectypes={bt.Order.Limit})
+
+
+def test_accepted_order_is_indexed_and_cancelled():
+    st = _run(_CancelAcceptedOrder)
+
+    assert not st.indexed_on_submit
+    assert st.indexed_after_accept
+    assert st.broker.get_orders_open() == []
+    assert st._open_orders() == []
+    assert st.trades_log == []
+
+
+class _CompletedOrderLeavesIndex(PortfolioStrategy):
+    def next(self):
+        self.bar = getattr(self, "bar", 0) + 1
+        if self.bar == 1:
+            self._track_order(self.buy(data=self.data, size=10), reason="테스트")
+        elif self.bar == 2:
+            self.open_after_fill = list(self._open_orders(self.data))
+
+
+def test_completed_order_leaves_index():
+    st = _run(_CompletedOrderLeavesIndex)
+
+    assert st.open_after_fill == []
+    assert [t["action"] for t in st.trades_log] == ["BUY"]
+    assert st.getposition(st.data).size == 10
+
+
+class _RebalanceThenManage(PortfolioStrategy):
+    def next(self):
+        self.bar = getattr(self, "bar", 0) + 1
+        if self.bar == 1:
+            self._track_order(self.buy(data=self.data, size=10), reason="테스트")
+        elif self.bar == 3:
+            # 리밸런싱 청산(시장가)을 낸 bar에서 포지션 관리가 같은 포지션에 매도 주문을 더 내지 않아야 함
+            current_date = self.data.datetime.date(0)
+            self.rebalance(current_date)
+            self.manage_position("005930", self.data, current_date)
+
+
+def test_rebalance_close_is_not_followed_by_more_sells_in_same_bar():
+    st = _run(_RebalanceThenManage)
+
+    assert [t["action"] for t in st.trades_log] == ["BUY", "SELL"]
+    assert st.getposition(st.data).size == 0
+    assert st.broker.get_orders_open() == []
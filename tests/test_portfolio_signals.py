@@ -0,0 +1,190 @@
+"""numpy 조회 테이블(CategorySignalTable/DisclosureTimeline/IndicatorConditionMatcher)과
+부분 선택(_stable_select_k)이 기존 bar 단위 pandas 구현과 같은 결과를 내는지 비교합니다."""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting.portfolio_backtest import (
+    CategorySignalTable,
+    DisclosureTimeline,
+    IndicatorConditionMatcher,
+    IndicatorTable,
+    _stable_select_k,
+    generate_category_signals,
+)
+
+# 같은 날짜 공시(01-03 2건), 날짜 미정렬 프레임을 모두 포함
+_DISCLOSURES = pd.DataFrame(
+    {
+        "report_type": ["유상증자 결정", "자기주식 취득 결정", "합병 결정", "기타공시", "전환사채권 발행결정"],
+        "event_type": ["유상증자", "자기주식 취득", "합병", "기타공시", "전환사채권"],
+        "category": ["자본변동", "주주환원", "기타", None, "자본변동"],
+        "disclosure": [2, 1, 3, 0, 2],
+    },
+    index=pd.to_datetime(["2024-01-03", "2024-01-03", "2024-01-05", "2024-01-08", "2024-01-10"]),
+)
+_EVENT_SIGNALS = {
+    "자기주식": {"action": "BUY", "delay_days": 1},
+    "전환사채": {"action": "SELL", "delay_days": 0},
+    "합병": {"action": "NEUTRAL", "delay_days": 0},
+}
+_CATEGORY_SIGNALS = {
+    "자본변동": {"action": "SELL", "delay_days": 2},
+    "기타": {"action": "NEUTRAL", "delay_days": 0},
+}
+_DAYS = [datetime(2024, 1, 1) + timedelta(days=d) for d in range(14)]
+
+
+def _reference_category_signal(df, category_signals, event_signals, current_date):
+    """기존 generate_category_signals(리스트 누적 버전)의 판단 규칙."""
+    recent = df[df.index <= current_date]
+    if recent.empty:
+        return {"action": "NEUTRAL", "categories": [], "signal_date": current_date, "event_type": ""}
+    latest = recent.iloc[-1]
+    latest_date = recent.index[-1]
+    event_type = latest.get("event_type", "")
+    report_type = latest.get("report_type", "")
+
+    found = None
+    for event_name, cfg in event_signals.items():
+        if event_name in event_type or event_name in report_type:
+            signal_date = latest_date + timedelta(days=cfg.get("delay_days", 0))
+            if signal_date <= current_date:
+                if cfg.get("action", "NEUTRAL") in ("BUY", "SELL"):
+                    found = (cfg["action"], latest.get("category", ""), event_name, signal_date)
+                break
+
+    neutral = []
+    if found is None and latest.get("category", "") in category_signals:
+        category = latest.get("category", "")
+        cfg = category_signals[category]
+        signal_date = latest_date + timedelta(days=cfg.get("delay_days", 0))
+        if signal_date <= current_date:
+            detail = {"category": category, "event_type": event_type, "disclosure_date": latest_date, "signal_date": signal_date}
+            if cfg.get("action", "NEUTRAL") in ("BUY", "SELL"):
+                found = (cfg["action"], category, event_type, signal_date)
+            else:
+                neutral.append(detail)
+
+    if found is not None:
+        action, category, name, signal_date = found
+        return {
+            "action": action,
+            "categories": [category],
+            "signal_date": signal_date,
+            "event_type": name,
+            "details": [{"category": category, "event_type": name, "disclosure_date": latest_date, "signal_date": signal_date}],
+        }
+    return {
+        "action": "NEUTRAL",
+        "categories": [s["category"] for s in neutral],
+        "signal_date": current_date,
+        "event_type": event_type,
+        "details": neutral,
+    }
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_category_signal_table_matches_reference(shuffle):
+    df = _DISCLOSURES.iloc[[3, 0, 4, 2, 1]] if shuffle else _DISCLOSURES
+    table = CategorySignalTable.from_frame(df, _CATEGORY_SIGNALS, _EVENT_SIGNALS)
+    for day in _DAYS:
+        expected = _reference_category_signal(df, _CATEGORY_SIGNALS, _EVENT_SIGNALS, day)
+        assert table.signal_at(day) == expected
+        assert generate_category_signals(df, _CATEGORY_SIGNALS, _EVENT_SIGNALS, day) == expected
+
+
+def test_category_signals_on_empty_disclosures():
+    empty = _DISCLOSURES.iloc[:0]
+    day = _DAYS[5]
+    expected = {"action": "NEUTRAL", "categories": [], "signal_date": day, "event_type": ""}
+    assert generate_category_signals(empty, _CATEGORY_SIGNALS, _EVENT_SIGNALS, day) == expected
+    assert CategorySignalTable.from_frame(empty, _CATEGORY_SIGNALS, _EVENT_SIGNALS).signal_at(day) == expected
+
+
+def test_disclosure_timeline_matches_loc_slice():
+    timeline = DisclosureTimeline.from_frame(_DISCLOSURES)
+    for day in _DAYS:
+        before = _DISCLOSURES.loc[: day.strftime("%Y-%m-%d")]
+        row = timeline.latest_pos(day.date())
+        if before.empty:
+            assert row == -1
+            continue
+        assert timeline.disclosure[row] == before.iloc[-1]["disclosure"]
+        assert timeline.event_type[row] == before.iloc[-1]["event_type"]
+
+    assert DisclosureTimeline.from_frame(_DISCLOSURES.iloc[:0]).latest_pos(date(2024, 1, 5)) == -1
+
+
+_INDICATORS = pd.DataFrame(
+    {
+        "report_type": ["유상증자 결정", "유상증자 결정", "자기주식 취득 결정", "유상증자 결정", "자기주식 취득 결정"],
+        "idc_nm": ["a", "a", "b", "a", "b"],
+        "idc_score": [0.7, np.nan, 0.5, 0.2, 1.5],
+    },
+    index=pd.to_datetime(["2024-01-02", "2024-01-04", "2024-01-04", "2024-01-08", "2024-01-09"]),
+)
+_CONDITIONS = [
+    {"report_type": "유상증자 결정", "idc_nm": "a", "action": "SELL", "delay_days": 1, "condition": {"operator": ">=", "min": 0.5}},
+    {"report_type": "자기주식 취득 결정", "idc_nm": "b", "action": "BUY", "delay_days": 0,
+     "condition": {"operator": "between", "min": 0.2, "max": 1.0}},
+    {"report_type": "자기주식 취득 결정", "idc_nm": "b", "action": "SELL", "delay_days": 0, "condition": {"operator": "==", "min": 1.5}},
+]
+_REFERENCE_OPS = {
+    "between": lambda s, lo, hi: (lo is None or s >= lo) and (hi is None or s <= hi),
+    ">=": lambda s, lo, hi: lo is not None and s >= lo,
+    "==": lambda s, lo, hi: (lo if lo is not None else hi) is not None and abs(s - (lo if lo is not None else hi)) < 1e-6,
+}
+
+
+def _reference_indicator_signal(df, conditions, current_date):
+    """기존 check_indicator_conditions(bar마다 프레임 필터링)의 판단 규칙."""
+    neutral = {"action": "NEUTRAL", "report_type": "", "idc_nm": "", "idc_score": None}
+    recent = df[df.index <= current_date]
+    for condition in conditions:
+        matching = recent[(recent["report_type"] == condition["report_type"]) & (recent["idc_nm"] == condition["idc_nm"])]
+        if matching.empty or pd.isna(matching.iloc[-1]["idc_score"]):
+            continue
+        score = matching.iloc[-1]["idc_score"]
+        cond = condition["condition"]
+        if not _REFERENCE_OPS[cond["operator"]](score, cond.get("min"), cond.get("max")):
+            continue
+        indicator_date = matching.index[-1]
+        signal_date = indicator_date + timedelta(days=condition["delay_days"])
+        if signal_date <= current_date:
+            return {
+                "action": condition["action"],
+                "report_type": condition["report_type"],
+                "idc_nm": condition["idc_nm"],
+                "idc_score": float(score),
+                "signal_date": signal_date,
+                "indicator_date": indicator_date,
+            }
+    return neutral
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_indicator_condition_matcher_matches_reference(shuffle):
+    df = _INDICATORS.iloc[[4, 0, 3, 1, 2]] if shuffle else _INDICATORS
+    matcher = IndicatorConditionMatcher.build(IndicatorTable.from_frame(df), _CONDITIONS)
+    for day in _DAYS:
+        assert matcher.signal_at(day) == _reference_indicator_signal(df, _CONDITIONS, day)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        np.array([3.0, 1.0, 2.0, 1.0, 3.0, 2.0, 1.0]),
+        np.array([5.0, 5.0, 5.0, 5.0]),
+        np.array([0.5, -1.0, 2.0]),
+    ],
+)
+@pytest.mark.parametrize("from_end", [False, True])
+def test_stable_select_k_matches_stable_argsort(key, from_end):
+    order = np.argsort(key, kind="stable")
+    for k in range(1, len(key) + 3):
+        expected = order[-k:] if from_end else order[:k]
+        np.testing.assert_array_equal(_stable_select_k(key, k, from_end=from_end), expected)